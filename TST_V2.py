@@ -1,143 +1,1331 @@
 import streamlit as st
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 import pytz
 import time
 import base64
+import html
 import io
+import os
 import re
-import uuid 
+import copy
+import hashlib
+import hmac
+import secrets
+import logging
+import csv
+import json
+import random
+import functools
+import xlsxwriter
+import threading
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageOps
 from st_supabase_connection import SupabaseConnection
+from postgrest.exceptions import APIError
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 
 # ==========================================
 # 1. CONFIG & THEME (WIDE MODE)
 # ==========================================
 st.set_page_config(
     page_title="TST V2 - Testing Issue Tracker",
-    page_icon="assets/logo.svg",
+    page_icon=os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "logo.svg"),
     layout="wide",
     initial_sidebar_state="expanded"
 )
 
+logger = logging.getLogger("tst")
+
 # ==========================================
 # 2. HELPER FUNCTIONS & NOTIFICATIONS
 # ==========================================
-def get_base64_image(image_path):
-    try:
-        with open(image_path, "rb") as f:
-            return base64.b64encode(f.read()).decode("utf-8")
-    except:
-        return ""
+# --- ASSET REGISTRY (DIBACA & DI-ENCODE SEKALI PER PROSES) ---
+ASSET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+ASSET_MIME = {".svg": "image/svg+xml", ".png": "image/png", ".jpg": "image/jpeg", ".jpeg": "image/jpeg"}
+HEADER_ICONS = ["Logo.svg", "Dashboard.svg", "Project.svg", "AddProject.svg", "delete.svg",
+                "Add.svg", "ListTable.svg", "Detail.svg", "Image.svg", "Chat.svg"]
+HEADER_CACHE_MAX = 512
 
-def render_header(icon_name, title, size=24):
-    icon_b64 = get_base64_image(f"assets/{icon_name}")
-    if icon_b64:
-        st.markdown(f"""
+class AssetRegistry:
+    def __init__(self, asset_dir=ASSET_DIR):
+        # Key lowercase: "Chat.svg" tetap ketemu "chat.svg" di host Linux (case-sensitive)
+        self.data_uris = {}
+        self._headers = {}
+        for name in sorted(os.listdir(asset_dir)) if os.path.isdir(asset_dir) else []:
+            mime = ASSET_MIME.get(os.path.splitext(name)[1].lower())
+            if not mime: continue
+            with open(os.path.join(asset_dir, name), "rb") as f:
+                self.data_uris[name.lower()] = f"data:{mime};base64,{base64.b64encode(f.read()).decode('utf-8')}"
+
+        missing = [n for n in HEADER_ICONS if n.lower() not in self.data_uris]
+        if missing:
+            logger.warning("Unresolved header icons in %s: %s", asset_dir, ", ".join(missing))
+
+    def data_uri(self, name):
+        return self.data_uris.get(name.lower())
+
+    def header(self, icon_name, title, size=24):
+        key = (icon_name.lower(), title, size)
+        if key not in self._headers:
+            if len(self._headers) >= HEADER_CACHE_MAX: self._headers.clear()
+            uri = self.data_uri(icon_name)
+            if uri:
+                self._headers[key] = f"""
         <div style="display: flex; align-items: center; gap: 12px; margin-bottom: 10px;">
-            <img src="data:image/svg+xml;base64,{icon_b64}" width="{size}" style="opacity: 0.9;">
-            <span style="font-size: 20px; font-weight: 700; color: #FFFFFF;">{title}</span>
+            <img src="{uri}" width="{size}" style="opacity: 0.9;">
+            <span style="font-size: 20px; font-weight: 700; color: #FFFFFF;">{html.escape(title)}</span>
         </div>
-        """, unsafe_allow_html=True)
-    else:
-        st.markdown(f"### {title}")
+        """
+            else:
+                self._headers[key] = f"### {html.escape(title)}"
+        return self._headers[key]
+
+@st.cache_resource
+def get_assets():
+    return AssetRegistry()
+
+assets = get_assets()
+
+def render_header(icon_name, title, size=24):
+    st.markdown(assets.header(icon_name, title, size), unsafe_allow_html=True)
 
 def get_wib_time():
     tz = pytz.timezone('Asia/Jakarta')
     return datetime.now(tz).strftime("%d/%m %H:%M")
 
+def format_wib(value):
+    if value is None or pd.isna(value):
+        return "-"
+    return pd.Timestamp(value).tz_convert('Asia/Jakarta').strftime("%d/%m/%Y %H:%M")
+
 # --- CUSTOM NOTIFICATION (FIXED FOR HOSTING) ---
 def show_notification(message, type="success"):
-    clean_type = type.lower().strip()
-    color = "#10B981" if clean_type == "success" else "#EF4444"
-    icon = "✅" if clean_type == "success" else "⚠️"
+    kind = "success" if type.lower().strip() == "success" else "error"
+    icon = "✅" if kind == "success" else "⚠️"
     
+    # CSS animasi ada di APP CSS (section 5), di sini cukup elemennya
     st.markdown(f"""
-        <style>
-            @keyframes slideDownFade {{
-                0% {{ top: -100px; opacity: 0; }}
-                10% {{ top: 30px; opacity: 1; }} 
-                90% {{ top: 30px; opacity: 1; }}
-                100% {{ top: -100px; opacity: 0; }}
-            }}
-            .floating-notif {{
-                position: fixed;
-                top: -100px;
-                left: 50%;
-                transform: translateX(-50%);
-                z-index: 999999;
-                background-color: {color};
-                color: white;
-                padding: 12px 24px;
-                border-radius: 50px;
-                box-shadow: 0 4px 20px rgba(0,0,0,0.4);
-                font-weight: 600;
-                display: flex;
-                align-items: center;
-                gap: 12px;
-                font-size: 16px;
-                animation: slideDownFade 4s ease-in-out forwards;
-                pointer-events: none;
-                white-space: nowrap;
-            }}
-        </style>
-        <div class="floating-notif">
+        <div class="floating-notif {kind}">
             <span>{icon}</span> <span>{message}</span>
         </div>
     """, unsafe_allow_html=True)
 
+# --- TRACING (PER RERUN: CALL SUPABASE/STORAGE + WAKTU PER SECTION, DISAMPLING) ---
+TRACE_SAMPLE_RATE = float(os.environ.get("TST_TRACE_SAMPLE", "0.05"))
+TRACE_HISTORY = 200
+TRACE_OPS = {"select", "insert", "upsert", "update", "delete"}
+perf_logger = logging.getLogger("tst.perf")
+_trace_local = threading.local()
+
+@st.cache_resource
+def get_trace_settings():
+    # Sekali per proses: sample rate bisa diubah admin dari sidebar, log perf ke stderr
+    if not perf_logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(message)s"))
+        perf_logger.addHandler(handler)
+        perf_logger.setLevel(logging.INFO)
+        perf_logger.propagate = False
+    return {"sample_rate": TRACE_SAMPLE_RATE}
+
+@st.cache_resource
+def get_trace_log():
+    # Trace terakhir dari semua session (untuk panel admin)
+    return deque(maxlen=TRACE_HISTORY)
+
+# Di-resolve di thread script: job di thread pool juga membuat trace, dan getter cache_resource
+# yang dipanggil dari thread tanpa ScriptRunContext memunculkan warning
+trace_settings = get_trace_settings()
+trace_log = get_trace_log()
+
+class RerunTrace:
+    def __init__(self, kind, user=None):
+        self.kind = kind
+        self.user = user
+        self.started_at = datetime.now(timezone.utc)
+        self.calls = {}     # "issues.select" -> [count, detik, bytes, error]
+        self.sections = {}  # nama -> detik (section boleh bertumpuk, mis. fragment di dalam "project view")
+        self._t0 = self._last = time.perf_counter()
+        self._mark = None
+
+    def record_call(self, key, seconds, size, failed=False):
+        entry = self.calls.setdefault(key, [0, 0.0, 0, 0])
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2] += size
+        entry[3] += int(failed)
+        self._last = time.perf_counter()
+
+    def add_section(self, name, seconds):
+        self.sections[name] = self.sections.get(name, 0.0) + seconds
+        self._last = time.perf_counter()
+
+    def checkpoint(self, name=None):
+        # Section top-level berurutan: checkpoint menutup section sebelumnya
+        now = time.perf_counter()
+        if self._mark: self.add_section(self._mark[0], now - self._mark[1])
+        self._mark = (name, now) if name else None
+
+    def summary(self, status):
+        self.checkpoint()
+        return {
+            "kind": self.kind, "user": self.user, "status": status,
+            "at": self.started_at.isoformat(timespec="seconds"),
+            "ms": round((self._last - self._t0) * 1000, 1),
+            "queries": sum(c[0] for c in self.calls.values()),
+            "db_ms": round(sum(c[1] for c in self.calls.values()) * 1000, 1),
+            "bytes": sum(c[2] for c in self.calls.values()),
+            "calls": {k: {"n": c[0], "ms": round(c[1] * 1000, 1), "bytes": c[2], "errors": c[3]} for k, c in self.calls.items()},
+            "sections": {k: round(v * 1000, 1) for k, v in self.sections.items()},
+        }
+
+def current_trace():
+    return getattr(_trace_local, "trace", None)
+
+def begin_trace(kind, user=None, force=False):
+    previous = current_trace()
+    if previous is not None:
+        # Run sebelumnya berhenti lewat st.rerun()/st.stop(): tutup dengan waktu aktivitas terakhirnya
+        finish_trace(previous, status="interrupted")
+    sampled = force or random.random() < trace_settings["sample_rate"]
+    _trace_local.trace = RerunTrace(kind, user) if sampled else None
+    return _trace_local.trace
+
+def finish_trace(trace, status="ok"):
+    if trace is None: return
+    if current_trace() is trace: _trace_local.trace = None
+    summary = trace.summary(status)
+    trace_log.append(summary)
+    perf_logger.info("perf %s", json.dumps(summary, separators=(",", ":")))
+
+def trace_checkpoint(name):
+    trace = current_trace()
+    if trace is not None: trace.checkpoint(name)
+
+@contextmanager
+def trace_section(name):
+    trace = current_trace()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if trace is not None: trace.add_section(name, time.perf_counter() - started)
+
+def traced(name):
+    def wrap(fn):
+        @functools.wraps(fn)
+        def run(*args, **kwargs):
+            with trace_section(name):
+                return fn(*args, **kwargs)
+        return run
+    return wrap
+
+def is_admin(user):
+    return bool(user and user.get("is_admin"))
+
+def traced_fragment(name, polled=False):
+    # Dipanggil saat rerun penuh = section; saat rerun fragment saja = trace sendiri.
+    # polled: fragment run_every (tiap beberapa detik) selalu disampling, juga untuk admin
+    def wrap(fn):
+        @functools.wraps(fn)
+        def run(*args, **kwargs):
+            ctx = get_script_run_ctx()
+            if not (ctx and ctx.fragment_ids_this_run):
+                with trace_section(name):
+                    return fn(*args, **kwargs)
+            user = st.session_state.get("user")
+            trace = begin_trace(f"fragment:{name}", user and user.get("username"), force=is_admin(user) and not polled)
+            status = "error"
+            try:
+                result = fn(*args, **kwargs)
+                status = "ok"
+                return result
+            finally:
+                finish_trace(trace, status)
+        return run
+    return wrap
+
+def traced_job(kind, force=False):
+    # Job di thread pool (upload evidence, hapus project): satu trace per job
+    def wrap(fn):
+        @functools.wraps(fn)
+        def run(*args, **kwargs):
+            trace = begin_trace(kind, force=force)
+            status = "error"
+            try:
+                result = fn(*args, **kwargs)
+                status = "ok"
+                return result
+            finally:
+                finish_trace(trace, status)
+        return run
+    return wrap
+
+def payload_size(data):
+    if data is None: return 0
+    if isinstance(data, (bytes, bytearray)): return len(data)
+    return len(json.dumps(data, default=str))
+
+def traced_call(key, fn, size_of=None):
+    trace = current_trace()
+    if trace is None: return fn()
+    started, result, failed = time.perf_counter(), None, True
+    try:
+        result = fn()
+        failed = False
+        return result
+    finally:
+        size = size_of() if size_of else payload_size(getattr(result, "data", None))
+        trace.record_call(key, time.perf_counter() - started, size, failed)
+
+class TracedQuery:
+    # Proxy builder query: operasi (select/insert/...) diingat, execute() dicatat ke trace aktif
+    def __init__(self, builder, target, op="select"):
+        self._builder = builder
+        self._target = target
+        self._op = op
+
+    def __getattr__(self, name):
+        attr = getattr(self._builder, name)
+        if not callable(attr): return attr
+        def call(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            if hasattr(result, "execute"):
+                return TracedQuery(result, self._target, name if name in TRACE_OPS else self._op)
+            return result
+        return call
+
+    def execute(self):
+        return traced_call(f"{self._target}.{self._op}", self._builder.execute)
+
+class TracedBucket:
+    def __init__(self, bucket, name):
+        self._bucket = bucket
+        self._name = name
+
+    def __getattr__(self, name):
+        return getattr(self._bucket, name)
+
+    def upload(self, path, file, file_options=None):
+        return traced_call(f"storage:{self._name}.upload",
+                           lambda: self._bucket.upload(path=path, file=file, file_options=file_options),
+                           size_of=lambda: len(file))
+
+    def remove(self, paths):
+        return traced_call(f"storage:{self._name}.remove", lambda: self._bucket.remove(paths), size_of=lambda: 0)
+
+class TracedStorage:
+    def __init__(self, storage):
+        self._storage = storage
+
+    def __getattr__(self, name):
+        return getattr(self._storage, name)
+
+    def from_(self, bucket):
+        return TracedBucket(self._storage.from_(bucket), bucket)
+
+class TracedClient:
+    def __init__(self, client):
+        self._client = client
+        self.storage = TracedStorage(client.storage)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    def rpc(self, fn, *args, **kwargs):
+        query = self._client.rpc(fn, *args, **kwargs)
+        return TracedQuery(query, "rpc", fn) if current_trace() else query
+
+class TracedConnection:
+    # Bungkus connection (Supabase / backend lokal); tanpa trace aktif builder asli dikembalikan apa adanya
+    def __init__(self, conn):
+        self._conn = conn
+        self.client = TracedClient(conn.client)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def table(self, name):
+        query = self._conn.table(name)
+        return TracedQuery(query, name) if current_trace() else query
+
 # ==========================================
 # 3. DATABASE CONNECTION
 # ==========================================
+# TST_BACKEND=sqlite: backend lokal di bench/backend.py (benchmark & demo offline, tanpa Supabase)
+BACKEND = os.environ.get("TST_BACKEND", "supabase").lower()
+
 try:
-    conn = st.connection("supabase", type=SupabaseConnection)
+    if BACKEND == "sqlite":
+        from bench.backend import get_sqlite_connection
+        conn = TracedConnection(get_sqlite_connection())
+    else:
+        conn = TracedConnection(st.connection("supabase", type=SupabaseConnection))
 except:
-    st.error("Gagal konek Supabase. Cek secrets.toml")
+    st.error("Gagal konek Supabase. Cek secrets.toml" if BACKEND == "supabase" else f"Gagal membuka backend '{BACKEND}'")
     st.stop()
 
-def upload_evidence(file_obj):
-    if file_obj:
-        try:
-            file_ext = file_obj.name.split('.')[-1]
-            file_name = f"{uuid.uuid4()}.{file_ext}"
-            conn.client.storage.from_("evidence").upload(
-                path=file_name,
-                file=file_obj.getvalue(),
-                file_options={"content-type": file_obj.type}
-            )
-            public_url = conn.client.storage.from_("evidence").get_public_url(file_name)
-            return public_url
-        except Exception as e:
-            show_notification(f"Upload failed: {e}", "error")
+# --- SHARED QUERY CACHE (LINTAS SESSION, TTL + LRU) ---
+CACHE_TTL = 30
+CACHE_MAX_ENTRIES = 512
+EXPORT_TTL = 6 * 3600
+EXPORT_MAX_ENTRIES = 8
+
+class QueryCache:
+    def __init__(self, ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (expires_at, tags, value)
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, loader, tags=()):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(entry[2])
+            self.misses += 1
+            generation = self._generation
+
+        value = loader()
+        if callable(tags): tags = tags(value)
+
+        with self._lock:
+            # Jangan simpan hasil yang sudah basi karena ada invalidasi selama fetch
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic() + self.ttl, frozenset(tags), value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return copy.deepcopy(value)
+
+    def invalidate(self, *tags):
+        tags = set(tags)
+        with self._lock:
+            self._generation += 1
+            for key in [k for k, e in self._entries.items() if e[1] & tags]:
+                del self._entries[key]
+
+    def peek(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                return copy.deepcopy(entry[2])
             return None
-    return None
 
-def login_user(username, password=None, by_session=False):
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries),
+                    "hit_rate": self.hits / total if total else 0.0}
+
+@st.cache_resource
+def get_query_cache():
+    return QueryCache()
+
+@st.cache_resource
+def get_export_cache():
+    # File export disimpan sampai datanya berubah (invalidasi), bukan sekadar TTL pendek
+    return QueryCache(ttl=EXPORT_TTL, max_entries=EXPORT_MAX_ENTRIES)
+
+query_cache = get_query_cache()
+export_cache = get_export_cache()
+
+def invalidate_issues(project, *issue_ids):
+    tags = ["issues:*", f"issues:{project}", *[f"issue:{i}" for i in issue_ids]]
+    query_cache.invalidate(*tags)
+    export_cache.invalidate(*tags)
+    # Frame lokal: tarik delta di sync berikutnya tanpa menunggu SYNC_INTERVAL
+    if project in issue_stores: issue_stores[project].stale = True
+
+def invalidate_project(project):
+    query_cache.invalidate("projects", "issues:*", f"project:{project}")
+    export_cache.invalidate("issues:*", f"project:{project}")
+    issue_stores.pop(project, None)
+
+# --- DATA ACCESS (FILTER, KOLOM & PAGING DI SISI SUPABASE) ---
+ISSUE_LOG_COLUMNS = "id,project,reporter,status,found_at,description,remarks,category,severity,resolved_at,resolved_by,updated_at"
+ISSUE_DETAIL_COLUMNS = "id,project,reporter,status,resolved_by,found_at,resolved_at,description,remarks,category,severity,evidence,evidence_thumb"
+PAGE_SIZE = 100
+COMMENT_PAGE_SIZE = 20
+SEARCH_TOP_K = 50
+SYNC_INTERVAL = 3
+SYNC_BATCH = 1000
+SYNC_OVERLAP = timedelta(seconds=5)
+SYNC_FULL_RELOAD_AFTER = timedelta(days=1)
+SEVERITY_OPTIONS = ["Low", "Medium", "High", "Critical"]
+HIGH_SEVERITY = ["High", "Critical"]
+CATEGORY_OPTIONS = ['UI/UX Defect', 'Functional Bug', 'Data Integrity', 'Feature Request', 'Performance', 'Others']
+WIB = pytz.timezone('Asia/Jakarta')
+
+def _project_tags(project):
+    return [f"issues:{project}", f"project:{project}"] if project else ["issues:*"]
+
+def fetch_projects():
+    def load():
+        res = conn.table("projects").select("name").order("name").execute()
+        return [p['name'] for p in res.data] if res.data else []
+    return query_cache.get(("projects",), load, tags=["projects"])
+
+def build_tsquery(search):
+    # "login err" -> "login:* & err:*" (prefix match untuk typeahead)
+    tokens = re.findall(r"\w+", (search or "").lower())
+    return " & ".join(f"{t}:*" for t in tokens)
+
+def wib_day_range(found_range):
+    # (date_awal, date_akhir) hari WIB -> [awal 00:00, akhir+1 00:00) dalam UTC
+    if not found_range or len(found_range) != 2:
+        return None
+    start, end = found_range
+    return (WIB.localize(datetime.combine(start, datetime.min.time())).astimezone(timezone.utc),
+            WIB.localize(datetime.combine(end + timedelta(days=1), datetime.min.time())).astimezone(timezone.utc))
+
+def apply_issue_filters(query, project=None, search=None, filters=None, found_range=None):
+    filters = dict(filters or {})
+    found_range = filters.pop("found_range", found_range)
+    if project:
+        query = query.eq("project", project)
+    day_range = wib_day_range(found_range)
+    if day_range:
+        # Pakai index (project, found_at)
+        query = query.gte("found_at", to_utc_param(day_range[0])).lt("found_at", to_utc_param(day_range[1]))
+    for col, val in filters.items():
+        if isinstance(val, (list, tuple)): query = query.in_(col, list(val))
+        else: query = query.eq(col, val)
+
+    search = (search or "").strip()
+    id_match = re.fullmatch(r"#?T-?(\d+)", search, re.IGNORECASE)
+    if id_match:
+        query = query.like("id", f"#T-{id_match.group(1)}%")
+    elif build_tsquery(search):
+        query = query.filter("search_tsv", "fts(simple)", build_tsquery(search))
+    return query
+
+def issue_sort_key(issue_id):
+    # Sama dengan kolom generated issues.id_sort: nomor di-pad 20 digit + id asli (#T-999 sebelum #T-1004)
+    issue_id = str(issue_id or "")
+    number = re.search(r"([0-9]+)$", issue_id)
+    return (number.group(1) if number else "").rjust(20, "0")[:20] + issue_id
+
+def iter_issue_chunks(project=None, columns=ISSUE_LOG_COLUMNS, chunk_size=SYNC_BATCH, found_range=None, search=None):
+    # Keyset paging di id_sort (urut nomor issue): tiap request O(chunk), tidak melambat di halaman belakang
+    columns = columns if isinstance(columns, str) else ",".join(columns)
+    last_id = None
+    while True:
+        query = apply_issue_filters(conn.table("issues").select(columns), project, search, found_range=found_range)
+        if last_id is not None: query = query.gt("id_sort", issue_sort_key(last_id))
+        rows = query.order("id_sort").limit(chunk_size).execute().data or []
+        if rows: yield rows
+        if len(rows) < chunk_size: break
+        last_id = rows[-1]['id']
+
+def search_issue_ids(project, search, filters=None):
+    # Full-text search tetap di Postgres, satu request: top-K id (issue terbaru dulu) + jumlah semua match.
+    # Filter ikut di query supaya top-K tidak habis oleh baris yang nanti disaring lokal
+    def load():
+        query = apply_issue_filters(conn.table("issues").select("id", count="exact"), project, search, filters)
+        res = query.order("id_sort", desc=True).limit(SEARCH_TOP_K).execute()
+        return [r['id'] for r in res.data or []], res.count or 0
+    key = ("search", project, search, repr(sorted((filters or {}).items())))
+    # Tag "search": komentar baru mengubah hasil search tanpa mengubah issue-nya
+    return query_cache.get(key, load, tags=["search", *_project_tags(project)])
+
+def fetch_issue(issue_id, columns=ISSUE_DETAIL_COLUMNS):
+    def load():
+        res = conn.table("issues").select(columns).eq("id", issue_id).execute()
+        return res.data[0] if res.data else None
+    def tags(row):
+        return [f"issue:{issue_id}"] + ([f"project:{row['project']}"] if row and row.get('project') else [])
+    return query_cache.get(("issue", issue_id, columns), load, tags=tags)
+
+def fetch_usernames():
+    def load():
+        res = conn.table("users").select("username").order("username").execute()
+        return [u['username'] for u in res.data or []]
+    return query_cache.get(("usernames",), load, tags=["users"])
+
+# --- ROLLUP DASHBOARD (DI-MAINTAIN TRIGGER, LIHAT MIGRATION dashboard_rollups) ---
+TREND_DAYS = 30
+LEADERBOARD_SIZE = 10
+
+def fetch_status_rollup():
+    def load():
+        res = conn.table("issue_status_rollup").select("project,severity,open_count,resolved_count").execute()
+        frame = pd.DataFrame(res.data or [], columns=["project", "severity", "open_count", "resolved_count"])
+        return frame.astype({"open_count": "int64", "resolved_count": "int64"})
+    return query_cache.get(("rollup", "status"), load, tags=["issues:*"])
+
+def fetch_daily_rollup(days=TREND_DAYS):
+    since = (datetime.now(WIB) - timedelta(days=days - 1)).date()
+    def load():
+        res = conn.table("issue_daily_rollup").select("project,day,opened,resolved,resolve_seconds") \
+            .gte("day", since.isoformat()).execute()
+        frame = pd.DataFrame(res.data or [], columns=["project", "day", "opened", "resolved", "resolve_seconds"])
+        frame["day"] = pd.to_datetime(frame["day"])
+        return frame.astype({"opened": "int64", "resolved": "int64", "resolve_seconds": "float64"})
+    return query_cache.get(("rollup", "daily", since.isoformat()), load, tags=["issues:*"])
+
+def fetch_user_rollup():
+    def load():
+        res = conn.table("issue_user_rollup").select("project,username,reported,resolved").execute()
+        frame = pd.DataFrame(res.data or [], columns=["project", "username", "reported", "resolved"])
+        return frame.astype({"reported": "int64", "resolved": "int64"})
+    return query_cache.get(("rollup", "users"), load, tags=["issues:*"])
+
+def format_duration(seconds):
+    if seconds is None or pd.isna(seconds): return "-"
+    hours = seconds / 3600
+    return f"{hours:.1f} h" if hours < 48 else f"{hours / 24:.1f} d"
+
+@traced("dashboard rollups")
+def dashboard_rollups(projects, days=TREND_DAYS):
+    status = fetch_status_rollup()
+    status = status[status["project"].isin(projects)]
+    daily = fetch_daily_rollup(days)
+    daily = daily[daily["project"].isin(projects)]
+    users = fetch_user_rollup()
+    users = users[users["project"].isin(projects)]
+
+    high = status["severity"].isin(HIGH_SEVERITY)
+    by_project = pd.DataFrame({
+        "Open": status.groupby("project")["open_count"].sum(),
+        "Resolved": status.groupby("project")["resolved_count"].sum(),
+        "High Open": status[high].groupby("project")["open_count"].sum(),
+    }).reindex(projects).fillna(0).astype(int)
+    window = daily.groupby("project")[["resolved", "resolve_seconds"]].sum().reindex(projects)
+    mttr = window["resolve_seconds"] / window["resolved"].where(window["resolved"] > 0)
+    by_project[f"MTTR ({days}d)"] = mttr.map(format_duration)
+
+    by_severity = status.pivot_table(index="project", columns="severity", values="open_count",
+                                     aggfunc="sum", fill_value=0)
+    by_severity = by_severity.reindex(columns=[s for s in SEVERITY_OPTIONS if s in by_severity.columns])
+
+    days_index = pd.date_range(end=pd.Timestamp(datetime.now(WIB).date()), periods=days, freq="D")
+    trend = daily.groupby("day")[["opened", "resolved"]].sum().reindex(days_index, fill_value=0)
+    trend.columns = ["Opened", "Resolved"]
+
+    resolved_total = window["resolved"].sum()
+    leaders = users.groupby("username")[["reported", "resolved"]].sum()
+    return {
+        "total": int(status["open_count"].sum() + status["resolved_count"].sum()),
+        "pending": int(status["open_count"].sum()),
+        "resolved": int(status["resolved_count"].sum()),
+        "high": int(status.loc[high, "open_count"].sum()),
+        "mttr": format_duration(window["resolve_seconds"].sum() / resolved_total if resolved_total else None),
+        "by_project": by_project,
+        "by_severity": by_severity,
+        "trend": trend,
+        "reporters": leaders["reported"][leaders["reported"] > 0].nlargest(LEADERBOARD_SIZE),
+        "resolvers": leaders["resolved"][leaders["resolved"] > 0].nlargest(LEADERBOARD_SIZE),
+    }
+
+# --- ISSUE STORE (FRAME LOKAL PER PROJECT, DELTA SYNC VIA updated_at + TOMBSTONE) ---
+def to_utc_param(dt):
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+def parse_ts(value):
+    return datetime.fromisoformat(value.replace("Z", "+00:00")) if value else None
+
+def as_category(values, known=()):
+    # Kategori tetap (urutan dropdown) + nilai lama di luar daftar tetap dipertahankan
+    extra = sorted(set(values.dropna().astype(str)) - set(known))
+    return values.astype(pd.CategoricalDtype(list(known) + extra, ordered=bool(known)))
+
+@traced("frame build")
+def to_issue_frame(rows, columns):
+    # Frame kanonik: category untuk kolom berulang, status bool, waktu datetime64 UTC
+    df = pd.DataFrame(rows, columns=columns)
+    return normalize_issue_frame(df.set_index("id") if "id" in df.columns else df)
+
+def normalize_issue_frame(df):
+    df = df.copy()
+    if "status" in df: df["status"] = df["status"].fillna(False).astype(bool)
+    if "severity" in df: df["severity"] = as_category(df["severity"], SEVERITY_OPTIONS)
+    if "category" in df: df["category"] = as_category(df["category"].astype(object), CATEGORY_OPTIONS)
+    for col in ("project", "reporter", "resolved_by"):
+        if col in df: df[col] = as_category(df[col].astype(object))
+    for col in ("found_at", "resolved_at", "updated_at"):
+        if col in df: df[col] = pd.to_datetime(df[col], utc=True, format="ISO8601")
+    return df
+
+def sort_issue_frame(df):
+    # Issue terbaru (nomor terbesar) di atas
+    return df.sort_index(key=lambda ids: ids.map(issue_sort_key), ascending=False)
+
+def issue_metrics(frame):
+    # Semua angka metrics dari satu pass vectorized
+    pending = ~frame["status"].to_numpy(dtype=bool)
+    high = frame["severity"].isin(HIGH_SEVERITY).to_numpy()
+    total = len(frame)
+    return {"total": total, "pending": int(pending.sum()), "resolved": total - int(pending.sum()),
+            "high": int((pending & high).sum())}
+
+class IssueStore:
+    # Satu frame per project, dipakai bersama semua session di proses ini (read-only: tiap merge bikin frame baru)
+    def __init__(self, project):
+        self.project = project
+        self.columns = ISSUE_LOG_COLUMNS.split(",")
+        self.frame = to_issue_frame([], self.columns)
+        self.version = 0
+        self.stale = True
+        self._watermark = None        # updated_at terbesar yang sudah ditarik
+        self._tombstone_mark = None   # deleted_at terbesar yang sudah diterapkan
+        self._synced_at = None
+        self._lock = threading.Lock()
+
+    @traced("issues sync")
+    def sync(self, force=False):
+        with self._lock:
+            now = datetime.now(timezone.utc)
+            fresh = self._synced_at and (now - self._synced_at).total_seconds() < SYNC_INTERVAL
+            if fresh and not (force or self.stale):
+                return self.frame
+
+            if self._synced_at is None or now - self._synced_at > SYNC_FULL_RELOAD_AFTER:
+                changed = self._full_load(now)
+            else:
+                changed = self._pull_delta()
+            self._synced_at, self.stale = now, False
+            if changed: self.version += 1
+            return self.frame
+
+    def _full_load(self, started):
+        rows = [r for chunk in iter_issue_chunks(self.project) for r in chunk]
+        self.frame = sort_issue_frame(to_issue_frame(rows, self.columns))
+        marks = [parse_ts(r['updated_at']) for r in rows if r.get('updated_at')]
+        self._watermark = max(marks) if marks else started
+        self._tombstone_mark = started
+        return True
+
+    def _pull_delta(self):
+        rows, since = [], to_utc_param(self._watermark - SYNC_OVERLAP)
+        while True:
+            # Overlap beberapa detik: transaksi yang commit telat tetap ketangkap, merge-nya idempotent
+            batch = (conn.table("issues").select(ISSUE_LOG_COLUMNS).eq("project", self.project)
+                     .gt("updated_at", since).order("updated_at").limit(SYNC_BATCH).execute().data or [])
+            rows += batch
+            if len(batch) < SYNC_BATCH: break
+            since = batch[-1]['updated_at']
+
+        tombstones = (conn.table("issue_tombstones").select("id,deleted_at").eq("project", self.project)
+                      .gt("deleted_at", to_utc_param(self._tombstone_mark - SYNC_OVERLAP)).execute().data or [])
+
+        # Baris overlap yang updated_at-nya sama dengan di frame = tidak berubah
+        known = self.frame['updated_at']
+        rows = [r for r in rows if r['id'] not in known.index or known[r['id']] != parse_ts(r['updated_at'])]
+        gone = [t['id'] for t in tombstones if t['id'] in self.frame.index]
+
+        if rows:
+            changed = pd.DataFrame(rows, columns=self.columns).drop_duplicates("id", keep="last").set_index("id")
+            merged = pd.concat([self.frame.drop(changed.index, errors="ignore").astype(object), changed.astype(object)])
+            self.frame = sort_issue_frame(normalize_issue_frame(merged))
+            self._watermark = max(self._watermark, *[parse_ts(r['updated_at']) for r in rows])
+        if gone:
+            self.frame = self.frame.drop(gone, errors="ignore")
+        if tombstones:
+            self._tombstone_mark = max(self._tombstone_mark, *[parse_ts(t['deleted_at']) for t in tombstones])
+        return bool(rows or gone)
+
+@st.cache_resource
+def get_issue_stores():
+    return {}
+
+issue_stores = get_issue_stores()  # juga dipakai job background lewat invalidate_issues
+
+def issue_store(project):
+    if project not in issue_stores:
+        issue_stores.setdefault(project, IssueStore(project))
+    return issue_stores[project]
+
+def issue_frame(project):
+    return issue_store(project).sync()
+
+@traced("frame filter")
+def filter_issue_frame(frame, project, search=None, filters=None, found_range=None):
+    filters = dict(filters or {})
+    found_range = filters.pop("found_range", found_range)
+    mask = pd.Series(True, index=frame.index)
+    day_range = wib_day_range(found_range)
+    if day_range:
+        mask &= (frame['found_at'] >= day_range[0]) & (frame['found_at'] < day_range[1])
+    for col, val in filters.items():
+        mask &= frame[col].isin(val) if isinstance(val, (list, tuple)) else frame[col] == val
+    if (search or "").strip():
+        ids, _ = search_issue_ids(project, search.strip(), dict(filters, found_range=found_range) if found_range else filters)
+        mask &= frame.index.isin(ids)
+    return frame[mask]
+
+# --- KOMENTAR (TABEL issue_comments, APPEND-ONLY) ---
+def fetch_comment_page(issue_id, before=None, limit=COMMENT_PAGE_SIZE):
+    # Halaman terbaru (before=None) berubah tiap ada pesan baru; halaman lama tidak pernah berubah
+    def load():
+        query = conn.table("issue_comments").select("id,username,msg,time").eq("issue_id", issue_id)
+        if before is not None:
+            query = query.lt("id", before)
+        rows = query.order("id", desc=True).limit(limit + 1).execute().data or []
+        return list(reversed(rows[:limit])), len(rows) > limit
+    tags = [f"issue:{issue_id}"] + ([f"comments:{issue_id}"] if before is None else [])
+    return query_cache.get(("comments", issue_id, before, limit), load, tags=tags)
+
+def add_comment(issue_id, username, msg):
+    conn.table("issue_comments").insert({"issue_id": issue_id, "username": username,
+                                         "msg": msg, "time": get_wib_time()}).execute()
+    query_cache.invalidate(f"comments:{issue_id}", "search")
+
+# --- ISSUE ID ALLOCATOR (SEQUENCE DI POSTGRES, LIHAT supabase/migrations) ---
+ID_RETRIES = 3
+
+def next_issue_id():
+    return conn.client.rpc("next_issue_id").execute().data
+
+def create_issue(fields):
+    # Retry dengan ID baru kalau bentrok (unique_violation), misal ID lama diisi manual
+    for attempt in range(ID_RETRIES):
+        new_id = next_issue_id()
+        try:
+            conn.table("issues").insert({"id": new_id, **fields}).execute()
+        except APIError as e:
+            if e.code == "23505" and attempt < ID_RETRIES - 1:
+                continue
+            raise
+        invalidate_issues(fields['project'])
+        return new_id
+
+# --- BATCH COMMIT ISSUE LOG (DARI DELTA data_editor) ---
+EDITOR_FIELDS = {'status': 'status', 'desc': 'description', 'remarks': 'remarks',
+                 'severity': 'severity', 'category': 'category'}
+
+@traced("editor diff")
+def build_issue_changes(rows, editor_state, username):
+    # Per baris hanya kolom yang diedit: kolom lain (mis. status yang baru di-resolve tester lain) tidak tertimpa
+    deletes = [rows[i]['id'] for i in editor_state.get("deleted_rows", [])]
+    updates = []
+    now = datetime.now(timezone.utc).isoformat()
+    for idx, edits in editor_state.get("edited_rows", {}).items():
+        orig = rows[int(idx)]
+        if edits.get('delete'):
+            deletes.append(orig['id'])
+            continue
+
+        change = {EDITOR_FIELDS[col]: val for col, val in edits.items()
+                  if col in EDITOR_FIELDS and val != orig.get(EDITOR_FIELDS[col])}
+        if 'status' in change:
+            change['resolved_at'] = now if change['status'] else None
+            change['resolved_by'] = username if change['status'] else None
+
+        if change:
+            updates.append({'id': orig['id'], **change})
+
+    updates = [r for r in updates if r['id'] not in deletes]
+    return updates, deletes
+
+def group_issue_updates(updates):
+    # Baris dengan perubahan yang sama persis (mis. resolve massal) digabung: satu update ... in_(id)
+    groups = {}
+    for row in updates:
+        values = {k: v for k, v in row.items() if k != 'id'}
+        groups.setdefault(repr(sorted(values.items())), (values, []))[1].append(row['id'])
+    return list(groups.values())
+
+def commit_issue_changes(project, updates, deletes):
+    # UPDATE (bukan upsert): issue yang sudah dihapus orang lain dilewati, tidak dibuat ulang.
+    # Satu request per kelompok perubahan + satu request delete. Return: jumlah issue yang terlewati
+    updated = 0
+    for values, ids in group_issue_updates(updates):
+        updated += len(conn.table("issues").update(values).in_("id", ids).execute().data or [])
+    if deletes:
+        conn.table("issues").delete(returning="minimal").in_("id", deletes).execute()
+    invalidate_issues(project, *[r['id'] for r in updates], *deletes)
+    return len(updates) - updated
+
+# --- EVIDENCE (RESIZE, THUMBNAIL, NAMA = HASH ISI, UPLOAD DI BACKGROUND) ---
+EVIDENCE_BUCKET = "evidence"
+EVIDENCE_MAX_SIDE = 1920
+THUMB_MAX_SIDE = 480
+UPLOAD_WORKERS = 4
+
+@st.cache_resource
+def get_upload_executor():
+    return ThreadPoolExecutor(max_workers=UPLOAD_WORKERS, thread_name_prefix="evidence")
+
+@st.cache_resource
+def get_upload_state():
+    # issue_id -> "uploading" / "failed", dan path -> public url yang sudah pasti ada di bucket
+    return {"pending": {}, "stored": {}}
+
+upload_state = get_upload_state()  # di-resolve di thread script, worker upload memakainya langsung
+
+def encode_image(img, max_side, quality):
+    img = img.copy()
+    img.thumbnail((max_side, max_side))
+    buf = io.BytesIO()
+    img.save(buf, format="WEBP", quality=quality)
+    return buf.getvalue()
+
+@traced("evidence encode")
+def process_evidence(data):
+    with Image.open(io.BytesIO(data)) as img:
+        img = ImageOps.exif_transpose(img)
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+        return encode_image(img, EVIDENCE_MAX_SIDE, 85), encode_image(img, THUMB_MAX_SIDE, 70)
+
+def store_object(path, data, content_type):
+    stored = upload_state["stored"]
+    if path in stored:
+        return stored[path]
+
+    bucket = conn.client.storage.from_(EVIDENCE_BUCKET)
     try:
-        if by_session:
-             response = conn.table("users").select("*").eq("username", username).execute()
-        else:
-             response = conn.table("users").select("*").eq("username", username).eq("password", password).execute()
-        
-        if len(response.data) > 0:
-            return response.data[0]
+        bucket.upload(path=path, file=data, file_options={"content-type": content_type})
+    except Exception as e:
+        # Nama file = hash isi, jadi "sudah ada" berarti duplikat: pakai object yang lama
+        if not any(k in str(e) for k in ("Duplicate", "already exists", "409")):
+            raise
+    stored[path] = bucket.get_public_url(path)
+    return stored[path]
+
+def upload_evidence(data, content_type, file_ext):
+    digest = hashlib.sha256(data).hexdigest()
+    try:
+        full, thumb = process_evidence(data)
+    except Exception:
+        # Tidak bisa dibaca Pillow: simpan file asli tanpa thumbnail
+        return store_object(f"{digest}.{file_ext}", data, content_type), None
+    return (store_object(f"{digest}.webp", full, "image/webp"),
+            store_object(f"thumbs/{digest}.webp", thumb, "image/webp"))
+
+@traced_job("evidence upload")
+def attach_evidence(issue_id, project, data, content_type, file_ext):
+    pending = upload_state["pending"]
+    try:
+        url, thumb_url = upload_evidence(data, content_type, file_ext)
+        conn.table("issues").update({"evidence": url, "evidence_thumb": thumb_url}).eq("id", issue_id).execute()
+        invalidate_issues(project, issue_id)
+        pending.pop(issue_id, None)
+    except Exception:
+        logger.exception("Evidence upload failed for %s", issue_id)
+        pending[issue_id] = "failed"
+
+def queue_evidence_upload(issue_id, project, file_obj):
+    # Baca bytes di thread script; upload & update row jalan di thread pool
+    data = file_obj.getvalue()
+    file_ext = file_obj.name.split('.')[-1].lower()
+    upload_state["pending"][issue_id] = "uploading"
+    get_upload_executor().submit(attach_evidence, issue_id, project, data, file_obj.type, file_ext)
+
+# --- EXPORT (LAZY, PER CHUNK, PER PROJECT) ---
+EXPORT_COLUMNS = ["id", "project", "status", "severity", "category", "description", "remarks",
+                  "reporter", "resolved_by", "found_at", "resolved_at", "evidence"]
+EXPORT_CHUNK = 1000
+EXPORT_FORMATS = {
+    "Excel": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "CSV": ("csv", "text/csv"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+}
+
+def write_xlsx(chunks, buf):
+    workbook = xlsxwriter.Workbook(buf, {"constant_memory": True})
+    sheet = workbook.add_worksheet("Backup")
+    sheet.write_row(0, 0, EXPORT_COLUMNS)
+    row_num = 1
+    for rows in chunks:
+        for row in rows:
+            sheet.write_row(row_num, 0, [row.get(c) for c in EXPORT_COLUMNS])
+            row_num += 1
+    workbook.close()
+
+def write_csv(chunks, buf):
+    text = io.TextIOWrapper(buf, encoding="utf-8-sig", newline="")
+    writer = csv.DictWriter(text, fieldnames=EXPORT_COLUMNS, extrasaction="ignore")
+    writer.writeheader()
+    for rows in chunks:
+        writer.writerows(rows)
+    text.flush()
+    text.detach()
+
+def write_parquet(chunks, buf):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    types = {"status": pa.bool_(), "found_at": pa.timestamp("us", tz="UTC"), "resolved_at": pa.timestamp("us", tz="UTC")}
+    schema = pa.schema([(c, types.get(c, pa.string())) for c in EXPORT_COLUMNS])
+    with pq.ParquetWriter(buf, schema) as writer:
+        for rows in chunks:
+            rows = [dict(r, found_at=parse_ts(r.get("found_at")), resolved_at=parse_ts(r.get("resolved_at"))) for r in rows]
+            writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+
+EXPORT_WRITERS = {"Excel": write_xlsx, "CSV": write_csv, "Parquet": write_parquet}
+
+def export_key(project, fmt, found_range=None):
+    return ("export", project, fmt, tuple(found_range or ()))
+
+def build_export(project, fmt, found_range=None):
+    def load():
+        buf = io.BytesIO()
+        # Section ini termasuk fetch per chunk; waktu DB-nya tercatat terpisah di calls "issues.select"
+        with trace_section(f"export {fmt}"):
+            EXPORT_WRITERS[fmt](iter_issue_chunks(project, EXPORT_COLUMNS, EXPORT_CHUNK, found_range), buf)
+        return buf.getvalue()
+    return export_cache.get(export_key(project, fmt, found_range), load, tags=_project_tags(project))
+
+# --- IMPORT (CSV/XLSX DENGAN KOLOM EXPORT, PARSE PER CHUNK, INSERT PER BATCH) ---
+IMPORT_CHUNK = 1000
+IMPORT_BATCH = 300
+IMPORT_MAX_ERRORS = 1000
+IMPORT_TRUE = {"true", "1", "yes", "y", "resolved", "done"}
+IMPORT_FALSE = {"", "false", "0", "no", "n", "pending", "open"}
+
+def next_issue_ids(n):
+    res = conn.client.rpc("next_issue_ids", {"n": n}).execute()
+    return [r if isinstance(r, str) else r["next_issue_ids"] for r in res.data or []]
+
+def read_import_chunks(file_obj, file_ext, chunk_size=IMPORT_CHUNK):
+    # Yield list of (nomor baris di file, dict kolom -> nilai mentah)
+    if file_ext == "csv":
+        text = io.TextIOWrapper(file_obj, encoding="utf-8-sig", newline="")
+        try:
+            chunk = []
+            reader = csv.DictReader(text)
+            reader.fieldnames  # baca header dulu
+            # Nomor baris awal record (sel bisa berisi newline, jadi bukan sekadar urutan record)
+            line_no = reader.line_num + 1
+            for row in reader:
+                chunk.append((line_no, row))
+                line_no = reader.line_num + 1
+                if len(chunk) == chunk_size:
+                    yield chunk
+                    chunk = []
+            if chunk: yield chunk
+        finally:
+            text.detach()
+        return
+
+    import openpyxl
+    workbook = openpyxl.load_workbook(file_obj, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = [str(h).strip() if h is not None else "" for h in next(rows, ())]
+        chunk = []
+        for line_no, values in enumerate(rows, start=2):
+            if all(v is None or str(v).strip() == "" for v in values): continue
+            chunk.append((line_no, dict(zip(header, values))))
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk: yield chunk
+    finally:
+        workbook.close()
+
+def parse_import_ts(value):
+    # ISO (hasil export), "dd/mm/YYYY HH:MM" (tampilan WIB), atau datetime dari sel Excel
+    if value is None or (isinstance(value, str) and not value.strip()): return None
+    if isinstance(value, datetime):
+        dt = value
+    else:
+        text = str(value).strip()
+        try:
+            dt = datetime.strptime(text, "%d/%m/%Y %H:%M")
+        except ValueError:
+            dt = parse_ts(text)
+    if dt.tzinfo is None: dt = WIB.localize(dt)
+    return dt.astimezone(timezone.utc).isoformat()
+
+def validate_import_row(raw, project, username):
+    def text(col):
+        value = raw.get(col)
+        return "" if value is None else str(value).strip()
+
+    if not text("description"): raise ValueError("description is empty")
+    severity = text("severity") or "Medium"
+    if severity not in SEVERITY_OPTIONS: raise ValueError(f"unknown severity '{severity}'")
+    category = text("category")
+    if category not in CATEGORY_OPTIONS: raise ValueError(f"unknown category '{category}'")
+    status = text("status").lower()
+    if status not in IMPORT_TRUE | IMPORT_FALSE: raise ValueError(f"unknown status '{text('status')}'")
+    status = status in IMPORT_TRUE
+
+    try:
+        found_at = parse_import_ts(raw.get("found_at")) or datetime.now(timezone.utc).isoformat()
+        resolved_at = parse_import_ts(raw.get("resolved_at")) if status else None
+    except (ValueError, TypeError):
+        raise ValueError("invalid found_at/resolved_at")
+    if status and not resolved_at: resolved_at = datetime.now(timezone.utc).isoformat()
+
+    return {
+        "project": project, "description": text("description"), "remarks": text("remarks"),
+        "severity": severity, "category": category, "status": status,
+        "found_at": found_at, "resolved_at": resolved_at,
+        "reporter": text("reporter") or username,
+        "resolved_by": (text("resolved_by") or username) if status else None,
+        "evidence": text("evidence") or None,
+    }
+
+def insert_issue_batch(batch):
+    # batch: list of (line_no, row). Return list of (line_no, error)
+    for attempt in range(ID_RETRIES):
+        rows = [dict(row, id=new_id) for (_, row), new_id in zip(batch, next_issue_ids(len(batch)))]
+        try:
+            conn.table("issues").insert(rows).execute()
+            return []
+        except APIError as e:
+            if e.code == "23505" and attempt < ID_RETRIES - 1:
+                continue
+            if len(batch) == 1:
+                return [(batch[0][0], e.message or str(e))]
+            break
+    # Batch ditolak: ulangi per baris supaya baris yang salah bisa dilaporkan
+    return [err for item in batch for err in insert_issue_batch([item])]
+
+@traced("import")
+def import_issues(project, file_obj, username, on_progress=None):
+    file_ext = file_obj.name.rsplit(".", 1)[-1].lower()
+    report = {"inserted": 0, "errors": []}
+    pending = []
+
+    def flush():
+        errors = insert_issue_batch(pending)
+        report["inserted"] += len(pending) - len(errors)
+        report["errors"].extend(errors)
+        pending.clear()
+
+    try:
+        for chunk in read_import_chunks(file_obj, file_ext):
+            for line_no, raw in chunk:
+                try:
+                    pending.append((line_no, validate_import_row(raw, project, username)))
+                except ValueError as e:
+                    report["errors"].append((line_no, str(e)))
+                if len(pending) == IMPORT_BATCH: flush()
+            if on_progress: on_progress(report["inserted"], len(report["errors"]))
+            if len(report["errors"]) >= IMPORT_MAX_ERRORS:
+                report["errors"].append((None, f"stopped after {IMPORT_MAX_ERRORS} errors"))
+                break
+        if pending: flush()
+    finally:
+        if report["inserted"]: invalidate_issues(project)
+    return report
+
+# --- DELETE PROJECT (BACKGROUND, PER BATCH, BISA DILANJUTKAN) ---
+DELETE_BATCH = 500
+PURGE_URL_CHUNK = 40  # URL evidence ~120 karakter; in_() masuk ke query string GET, jaga jauh di bawah limit URL
+
+@st.cache_resource
+def get_delete_executor():
+    # Satu worker: job hapus project dijalankan berurutan
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="project-delete")
+
+@st.cache_resource
+def get_delete_jobs():
+    # project -> {"status", "total", "issues", "objects", "error"} (progress di proses ini)
+    return {}
+
+delete_jobs = get_delete_jobs()
+
+def evidence_path(url):
+    marker = f"/object/public/{EVIDENCE_BUCKET}/"
+    if not url or marker not in url:
+        return None
+    return url.split(marker, 1)[1].split("?", 1)[0]
+
+def purge_evidence(project, rows):
+    urls = {u for r in rows for u in (r.get('evidence'), r.get('evidence_thumb')) if u}
+    if not urls:
+        return 0
+
+    # Object dinamai hash isi, jadi bisa juga dipakai issue di project lain: yang itu jangan dihapus
+    shared = set()
+    candidates = sorted(urls)
+    for i in range(0, len(candidates), PURGE_URL_CHUNK):
+        chunk = candidates[i:i + PURGE_URL_CHUNK]
+        for col in ("evidence", "evidence_thumb"):
+            res = conn.table("issues").select(col).in_(col, chunk).neq("project", project).execute()
+            shared |= {r[col] for r in res.data or []}
+
+    paths = [p for p in (evidence_path(u) for u in urls - shared) if p]
+    if paths:
+        conn.client.storage.from_(EVIDENCE_BUCKET).remove(paths)
+        stored = upload_state["stored"]
+        for path in paths: stored.pop(path, None)
+    return len(paths)
+
+@traced_job("project delete", force=True)
+def run_project_delete(project, job):
+    try:
+        # Tiap batch idempotent (hapus object dulu, baru row), jadi aman diulang kalau terputus
+        while True:
+            rows = (conn.table("issues").select("id,evidence,evidence_thumb")
+                    .eq("project", project).limit(DELETE_BATCH).execute().data or [])
+            if not rows: break
+            job["objects"] += purge_evidence(project, rows)
+            conn.table("issues").delete(returning="minimal").in_("id", [r['id'] for r in rows]).execute()
+            job["issues"] += len(rows)
+            conn.table("project_deletions").update({
+                "deleted_issues": job["issues"], "deleted_objects": job["objects"],
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+            }).eq("project", project).execute()
+            invalidate_issues(project)
+
+        conn.table("projects").delete(returning="minimal").eq("name", project).execute()
+        conn.table("project_deletions").update({"status": "done", "updated_at": datetime.now(timezone.utc).isoformat()}).eq("project", project).execute()
+        job["status"] = "done"
+    except Exception as e:
+        logger.exception("Project delete failed for %s", project)
+        job["status"], job["error"] = "failed", str(e)
+        try:
+            conn.table("project_deletions").update({"status": "failed", "error": str(e)}).eq("project", project).execute()
+        except Exception:
+            logger.exception("Could not record failed delete for %s", project)
+    finally:
+        invalidate_project(project)
+
+def start_project_delete(project):
+    if delete_jobs.get(project, {}).get("status") == "running":
+        return
+
+    existing = conn.table("project_deletions").select("*").eq("project", project).execute().data
+    prev = existing[0] if existing and existing[0]["status"] != "done" else {}
+    remaining = conn.table("issues").select("id", count="exact", head=True).eq("project", project).execute().count or 0
+    done_issues, done_objects = prev.get("deleted_issues", 0), prev.get("deleted_objects", 0)
+
+    conn.table("project_deletions").upsert({
+        "project": project, "status": "running", "error": None, "total_issues": done_issues + remaining,
+        "deleted_issues": done_issues, "deleted_objects": done_objects,
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+    }, on_conflict="project").execute()
+    job = delete_jobs[project] = {"status": "running", "total": done_issues + remaining,
+                                  "issues": done_issues, "objects": done_objects, "error": None}
+    get_delete_executor().submit(run_project_delete, project, job)
+
+@st.cache_resource
+def resume_project_deletions():
+    # Sekali per proses: lanjutkan job yang terputus (restart/crash). Job yang gagal tidak diulang
+    # otomatis (bisa gagal terus tiap start), cukup ditampilkan lagi dengan tombol Retry
+    try:
+        rows = (conn.table("project_deletions").select("*")
+                .in_("status", ["running", "failed"]).execute().data or [])
+        for row in rows:
+            if row['status'] == "running":
+                start_project_delete(row['project'])
+            else:
+                delete_jobs[row['project']] = {"status": "failed", "total": row['total_issues'],
+                                               "issues": row['deleted_issues'], "objects": row['deleted_objects'],
+                                               "error": row.get('error')}
+    except Exception:
+        logger.exception("Could not resume project deletions")
+    return True
+
+resume_project_deletions()
+
+# --- AUTH (PASSWORD HASH + SESSION TOKEN, LIHAT supabase/migrations) ---
+PBKDF2_ITERATIONS = 310000
+SESSION_TTL = timedelta(days=14)
+SESSION_CACHE_TTL = 300
+SESSION_CACHE_MAX_ENTRIES = 1024
+PRIVATE_USER_FIELDS = ("password", "password_hash")
+
+@st.cache_resource
+def get_session_cache():
+    return QueryCache(ttl=SESSION_CACHE_TTL, max_entries=SESSION_CACHE_MAX_ENTRIES)
+
+session_cache = get_session_cache()
+
+def hash_password(password, salt=None, iterations=PBKDF2_ITERATIONS):
+    salt = salt or secrets.token_bytes(16)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
+    return f"pbkdf2_sha256${iterations}${base64.b64encode(salt).decode()}${base64.b64encode(digest).decode()}"
+
+def verify_password(password, stored):
+    try:
+        _, iterations, salt, _ = stored.split("$")
+        expected = hash_password(password, base64.b64decode(salt), int(iterations))
+    except ValueError:
+        return False
+    return hmac.compare_digest(expected, stored)
+
+def public_user(user):
+    return {k: v for k, v in user.items() if k not in PRIVATE_USER_FIELDS}
+
+def token_hash(token):
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+def login_user(username, password):
+    try:
+        rows = conn.table("users").select("*").eq("username", username).execute().data
+    except Exception:
+        logger.exception("Login query failed")
+        return None
+    if not rows:
         return None
-    except:
+
+    user = rows[0]
+    if user.get("password_hash"):
+        ok = verify_password(password, user["password_hash"])
+    else:
+        # Akun lama (plaintext): cek sekali, lalu ganti ke hash
+        # Bandingkan bytes: compare_digest menolak str non-ASCII (TypeError)
+        ok = user.get("password") is not None and hmac.compare_digest(str(user["password"]).encode("utf-8"),
+                                                                       password.encode("utf-8"))
+        if ok:
+            conn.table("users").update({"password_hash": hash_password(password), "password": None}).eq("username", username).execute()
+    return public_user(user) if ok else None
+
+def create_session(user):
+    token = secrets.token_urlsafe(32)
+    conn.table("user_sessions").insert({
+        "token_hash": token_hash(token), "username": user['username'],
+        "expires_at": (datetime.now(timezone.utc) + SESSION_TTL).isoformat(),
+    }).execute()
+    return token
+
+def resolve_session(token):
+    # Token -> user lewat cache in-process: reload/reconnect tidak query DB lagi
+    key = token_hash(token)
+    def load():
+        rows = (conn.table("user_sessions").select("expires_at,revoked_at,users(*)")
+                .eq("token_hash", key).execute().data)
+        if not rows or rows[0].get("revoked_at") or not rows[0].get("users"):
+            return None
+        return {"user": public_user(rows[0]["users"]), "expires_at": rows[0]["expires_at"]}
+    session = session_cache.get(("session", key), load, tags=[f"session:{key}"])
+    if not session or datetime.fromisoformat(session["expires_at"]) <= datetime.now(timezone.utc):
         return None
+    return session["user"]
+
+def revoke_session(token):
+    key = token_hash(token)
+    conn.table("user_sessions").update({"revoked_at": datetime.now(timezone.utc).isoformat()}).eq("token_hash", key).execute()
+    session_cache.invalidate(f"session:{key}")
 
 # ==========================================
 # 4. SESSION STATE & INIT
 # ==========================================
 if 'user' not in st.session_state: st.session_state.user = None
-if 'active_ticket_id' not in st.session_state: st.session_state.active_ticket_id = None
+if 'session_token' not in st.session_state: st.session_state.session_token = None
 if 'notification_queue' not in st.session_state: st.session_state.notification_queue = None
+if 'editor_rev' not in st.session_state: st.session_state.editor_rev = 0
+st.session_state.detail_open = None  # rerun penuh selalu menutup dialog Issue Detail
+
+# --- TRACE RERUN INI (admin selalu di-trace, user lain disampling) ---
+rerun_trace = begin_trace("rerun", st.session_state.user and st.session_state.user.get("username"),
+                          force=is_admin(st.session_state.user))
+trace_checkpoint("auth")
 
 # --- AUTO LOGIN LOGIC (ANTI REFRESH) ---
 query_params = st.query_params
-if st.session_state.user is None and "u" in query_params:
-    username_from_url = query_params["u"]
-    user_data = login_user(username_from_url, by_session=True)
+if st.session_state.user is None and "s" in query_params:
+    user_data = resolve_session(query_params["s"])
     if user_data:
         st.session_state.user = user_data
+        st.session_state.session_token = query_params["s"]
+    else:
+        del st.query_params["s"]
 
 # --- HANDLE PENDING NOTIFICATION ---
 if st.session_state.notification_queue:
@@ -148,7 +1336,9 @@ if st.session_state.notification_queue:
 # ==========================================
 # 5. CSS STYLE
 # ==========================================
-st.markdown("""
+@st.cache_resource
+def get_app_css():
+    return """
 <style>
     @import url('https://fonts.googleapis.com/css2?family=Plus+Jakarta+Sans:wght@400;500;600;700&display=swap');
     html, body, .stApp { font-family: 'Plus Jakarta Sans', sans-serif; background-color: #0F172A; }
@@ -173,8 +1363,39 @@ st.markdown("""
         padding-top: 23px !important; /* Menyamakan tinggi dengan uploader */
     }
     
+    /* FLOATING NOTIFICATION (lihat show_notification) */
+    @keyframes slideDownFade {
+        0% { top: -100px; opacity: 0; }
+        10% { top: 30px; opacity: 1; } 
+        90% { top: 30px; opacity: 1; }
+        100% { top: -100px; opacity: 0; }
+    }
+    .floating-notif {
+        position: fixed;
+        top: -100px;
+        left: 50%;
+        transform: translateX(-50%);
+        z-index: 999999;
+        color: white;
+        padding: 12px 24px;
+        border-radius: 50px;
+        box-shadow: 0 4px 20px rgba(0,0,0,0.4);
+        font-weight: 600;
+        display: flex;
+        align-items: center;
+        gap: 12px;
+        font-size: 16px;
+        animation: slideDownFade 4s ease-in-out forwards;
+        pointer-events: none;
+        white-space: nowrap;
+    }
+    .floating-notif.success { background-color: #10B981; }
+    .floating-notif.error { background-color: #EF4444; }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+trace_checkpoint("css")
+st.markdown(get_app_css(), unsafe_allow_html=True)
 
 # ==========================================
 # 6. MAIN APP FLOW
@@ -182,6 +1403,7 @@ st.markdown("""
 
 # --- A. LOGIN PAGE ---
 if st.session_state.user is None:
+    trace_checkpoint("login page")
     st.markdown("<br><br>", unsafe_allow_html=True)
     c_left, c_center, c_right = st.columns([1, 1.2, 1])
 
@@ -197,38 +1419,74 @@ if st.session_state.user is None:
                     with st.spinner("Verifying..."):
                         user = login_user(u, p)
                         if user:
+                            token = create_session(user)
                             st.session_state.user = user
-                            st.query_params["u"] = user['username']
+                            st.session_state.session_token = token
+                            st.query_params["s"] = token
                             st.rerun()
                         else:
                             show_notification("Invalid Username or Password", "error")
 
 # --- B. DASHBOARD APPLICATION ---
 else:
-    # FETCH DATA
-    proj_data = conn.table("projects").select("*").execute()
-    projects_list = [p['name'] for p in proj_data.data] if proj_data.data else []
+    # FETCH DATA (issues diambil per project & per halaman di MAIN CONTENT)
+    trace_checkpoint("sidebar")
+    projects_list = [p for p in fetch_projects() if delete_jobs.get(p, {}).get("status") != "running"]
 
-    issues_data = conn.table("issues").select("*").execute()
-    all_issues = issues_data.data if issues_data.data else []
-    
-    CATEGORY_OPTIONS = ['UI/UX Defect', 'Functional Bug', 'Data Integrity', 'Feature Request', 'Performance', 'Others']
 
-    # --- MODAL DETAIL ---
-    @st.dialog("Issue Detail", width="large")
+    # --- DISCUSSION (FRAGMENT: kirim/muat pesan tidak me-rerun dialog & halaman) ---
+    @st.fragment
+    @traced_fragment("discussion")
+    def discussion_panel(issue_id):
+        # Hanya N pesan terbaru; halaman lama dimuat kalau diminta
+        pages_key = f"chat_pages_{issue_id}"
+        txt_key = f"txt_{issue_id}"
+        pages, before, has_more = [], None, False
+        for _ in range(st.session_state.get(pages_key, 1)):
+            rows, has_more = fetch_comment_page(issue_id, before)
+            pages.append(rows)
+            if not has_more or not rows: break
+            before = rows[0]['id']
+        comments = [c for rows in reversed(pages) for c in rows]
+
+        def send_comment():
+            if st.session_state.get(txt_key):
+                add_comment(issue_id, st.session_state.user['username'], st.session_state[txt_key])
+                st.session_state[txt_key] = ""
+
+        chat_container = st.container(height=300)
+        with chat_container:
+            if has_more:
+                st.button("Load older messages", key=f"older_{issue_id}", use_container_width=True,
+                          on_click=lambda: st.session_state.update({pages_key: len(pages) + 1}))
+            if not comments: st.caption("No comments yet.")
+            for chat in comments:
+                with st.chat_message("user"):
+                    st.markdown(f"**{chat['username']}** <span style='color:grey; font-size:10px;'>{chat['time']}</span>", unsafe_allow_html=True)
+                    st.write(chat['msg'])
+
+        c_in, c_btn = st.columns([4, 1], vertical_alignment="bottom")
+        with c_in: st.text_input("Msg", key=txt_key, label_visibility="collapsed", placeholder="Type comment...")
+        with c_btn: st.button("Send", key=f"snd_{issue_id}", use_container_width=True, on_click=send_comment)
+
+    # --- MODAL DETAIL (detail_open: live sync tidak me-rerun penuh selama dialog terbuka) ---
+    def close_issue_detail():
+        st.session_state.detail_open = None
+
+    @st.dialog("Issue Detail", width="large", on_dismiss=close_issue_detail)
+    @traced_fragment("issue detail")
     def show_issue_detail(issue_id):
-        res = conn.table("issues").select("*").eq("id", issue_id).execute()
-        if not res.data:
+        issue_data = fetch_issue(issue_id)
+        if not issue_data:
             st.error("Issue not found.")
             return
 
-        issue_data = res.data[0]
         c1, c2 = st.columns([3, 1])
         with c1:
             st.subheader(f"{issue_data['id']} - {issue_data.get('category', '-')}")
-            st.caption(f"Project: **{issue_data['project']}** | Reporter: **{issue_data['reporter']}**")
+            st.caption(f"Project: **{issue_data['project']}** | Reporter: **{issue_data['reporter']}** | Found: **{format_wib(issue_data.get('found_at'))}**")
         with c2:
-            if issue_data['status']: st.success(f"RESOLVED by {issue_data.get('resolved_by', 'Unknown')}")
+            if issue_data['status']: st.success(f"RESOLVED by {issue_data.get('resolved_by', 'Unknown')} ({format_wib(issue_data.get('resolved_at'))})")
             else: st.error("PENDING")
 
         st.markdown("---")
@@ -240,41 +1498,256 @@ else:
             with st.container(border=True):
                 render_header("Image.svg", "Evidence", size=20)
                 existing_img = issue_data.get('evidence')
+                upload_status = upload_state["pending"].get(issue_id)
                 if existing_img:
-                    st.image(existing_img, caption="Evidence Image", use_container_width=True)
+                    st.image(issue_data.get('evidence_thumb') or existing_img, caption="Evidence Image", use_container_width=True)
                     st.markdown(f"[Open Full Image]({existing_img})")
+                elif upload_status == "uploading": st.info("Evidence is still uploading...")
+                elif upload_status == "failed": st.warning("Evidence upload failed.")
                 else: st.info("No screenshot.")
 
         with col_right:
             with st.container(border=True):
                 render_header("Chat.svg", "Discussion", size=20)
-                comments = issue_data.get('comments', []) or []
-                chat_container = st.container(height=300)
-                with chat_container:
-                    if not comments: st.caption("No comments yet.")
-                    for chat in comments:
-                        with st.chat_message("user"):
-                            st.markdown(f"**{chat['user']}** <span style='color:grey; font-size:10px;'>{chat['time']}</span>", unsafe_allow_html=True)
-                            st.write(chat['msg'])
-
-                c_in, c_btn = st.columns([4, 1], vertical_alignment="bottom")
-                with c_in: txt = st.text_input("Msg", key=f"txt_{issue_id}", label_visibility="collapsed", placeholder="Type comment...")
-                with c_btn:
-                    if st.button("Send", key=f"snd_{issue_id}", use_container_width=True):
-                        if txt:
-                            new_chat = {"user": st.session_state.user['username'], "msg": txt, "time": get_wib_time()}
-                            comments.append(new_chat)
-                            conn.table("issues").update({"comments": comments}).eq("id", issue_id).execute()
-                            st.session_state.active_ticket_id = issue_id
+                discussion_panel(issue_id)
+
+    # --- QUICK ADD (FRAGMENT: mengetik tidak me-rerun seluruh halaman) ---
+    @st.fragment
+    @traced_fragment("quick add")
+    def quick_add_fragment(project):
+        with st.container(border=True):
+            render_header("Add.svg", "Quick Add Issue", size=20)
+            
+            # Baris 1: Desc & Remarks (Seimbang 1:1)
+            c_desc, c_rem = st.columns([1, 1]) 
+            with c_desc: desc_in = st.text_input("Desc", label_visibility="collapsed", placeholder="Bug description...")
+            with c_rem: rem_in = st.text_input("Rem", label_visibility="collapsed", placeholder="Expected behavior...")
+            
+            # Baris 2: Severity & Category (Seimbang 1:1)
+            c_sev, c_cat = st.columns([1, 1])
+            with c_sev: sev_in = st.selectbox("Severity", ["Low", "Medium", "High"], label_visibility="collapsed")
+            with c_cat: cat_in = st.selectbox("Category", CATEGORY_OPTIONS, label_visibility="collapsed")
+            
+            # Baris 3: Uploader & Tombol (Sejajar)
+            c_up_btn, c_submit = st.columns([4, 1], vertical_alignment="center")
+            with c_up_btn: 
+                uploaded_file = st.file_uploader("Evidence", type=['png', 'jpg', 'jpeg'], label_visibility="collapsed")
+            with c_submit:
+                # Tombol akan otomatis sejajar karena vertical_alignment="bottom" dan trik CSS
+                if st.button("Submit Issue", use_container_width=True, type="primary"):
+                    if desc_in:
+                        with st.spinner("Submitting..."):
+                            try:
+                                new_id = create_issue({
+                                    "project": project, "description": desc_in, "remarks": rem_in,
+                                    "severity": sev_in, "category": cat_in, "status": False,
+                                    "found_at": datetime.now(timezone.utc).isoformat(), "reporter": st.session_state.user['username'], "evidence": None
+                                })
+                                if uploaded_file:
+                                    queue_evidence_upload(new_id, project, uploaded_file)
+                            except Exception as e:
+                                new_id = None
+                                show_notification(f"Create failed: {e}", "error")
+
+                        if new_id:
+                            # Mutasi: rerun penuh supaya metrics & Issue Log ikut ter-update
+                            st.session_state.notification_queue = (f"Issue {new_id} Created!", "success")
                             st.rerun()
 
+    # --- IMPORT (FRAGMENT: pilih file tidak me-rerun seluruh halaman) ---
+    @st.fragment
+    @traced_fragment("import")
+    def import_fragment(project):
+        report_key = f"import_report_{project}"
+        with st.expander("Import issues from CSV / Excel"):
+            st.caption("Use the export columns. `id` and `project` are ignored: every row gets a new #T- id in this project.")
+            c_file, c_btn = st.columns([4, 1], vertical_alignment="center")
+            with c_file:
+                import_file = st.file_uploader("Import file", type=["csv", "xlsx"], key=f"import_file_{project}",
+                                               label_visibility="collapsed")
+            with c_btn:
+                start = st.button("Import", key=f"import_btn_{project}", use_container_width=True,
+                                  type="primary", disabled=import_file is None)
+
+            if start:
+                progress = st.empty()
+                try:
+                    report = import_issues(project, import_file, st.session_state.user['username'],
+                                           on_progress=lambda ok, bad: progress.caption(f"Imported {ok} rows, {bad} errors..."))
+                except Exception as e:
+                    report = None
+                    show_notification(f"Import failed: {e}", "error")
+                if report is not None:
+                    st.session_state[report_key] = report
+                    if report["inserted"]:
+                        # Mutasi: rerun penuh supaya metrics & Issue Log ikut ter-update
+                        st.session_state.notification_queue = (f"{report['inserted']} issues imported!", "success")
+                        st.rerun()
+
+            report = st.session_state.get(report_key)
+            if report:
+                st.caption(f"Last import: {report['inserted']} rows imported, {len(report['errors'])} rows rejected.")
+                if report["errors"]:
+                    st.dataframe(pd.DataFrame(report["errors"], columns=["Row", "Error"]),
+                                 use_container_width=True, hide_index=True)
+
+    # --- ISSUE LOG (FRAGMENT: edit di tabel hanya me-rerun tabel ini) ---
+    @st.fragment
+    @traced_fragment("issue log")
+    def issue_log_fragment(project, page, search, filters):
+        view = filter_issue_frame(issue_frame(project), project, search, filters)
+        page_rows = view.iloc[page * PAGE_SIZE:(page + 1) * PAGE_SIZE].reset_index()
+        page_rows = page_rows.astype(object).where(page_rows.notna(), None).to_dict("records")
+
+        # Selama ada edit yang belum disimpan, tabel tetap pakai snapshot yang sama
+        # (delta edited_rows berbasis posisi baris; merge dari sync tidak boleh menggeser baris)
+        snap_key = f"rows_{project}_{page}"
+        editor_key = f"editor_{project}_{page}_{st.session_state.editor_rev}"
+        pending = st.session_state.get(editor_key, {})
+        if snap_key in st.session_state and (pending.get("edited_rows") or pending.get("deleted_rows")):
+            filtered_issues = st.session_state[snap_key]
+        else:
+            if st.session_state.get(snap_key) not in (None, page_rows):
+                st.session_state.editor_rev += 1
+                editor_key = f"editor_{project}_{page}_{st.session_state.editor_rev}"
+            st.session_state[snap_key] = filtered_issues = page_rows
+
+        df = pd.DataFrame(filtered_issues, columns=["id"] + view.columns.tolist())
+        df['delete'] = False
+        df = df.rename(columns={'description': 'desc'})
+        for col in ('found_at', 'resolved_at'):
+            df[col] = pd.to_datetime(df[col], utc=True).dt.tz_convert('Asia/Jakarta')
+
+        df_display = df[['delete', 'status', 'id', 'found_at', 'desc', 'remarks', 'category', 'severity', 'resolved_at']]
+
+        st.data_editor(
+            df_display,
+            column_config={
+                "delete": st.column_config.CheckboxColumn("Del", width="small"),
+                "status": st.column_config.CheckboxColumn("Done", width="small"),
+                "id": st.column_config.TextColumn("ID", width="small", disabled=True),
+                "desc": st.column_config.TextColumn("Description", width="large"),
+                "remarks": st.column_config.TextColumn("Remarks", width="medium"),
+                "category": st.column_config.SelectboxColumn("Category", options=CATEGORY_OPTIONS, required=True), 
+                "severity": st.column_config.SelectboxColumn("Severity", options=SEVERITY_OPTIONS, required=True),
+                "found_at": st.column_config.DatetimeColumn("Found", format="DD/MM/YY HH:mm", disabled=True, width="small"),
+                "resolved_at": st.column_config.DatetimeColumn("Resolved", format="DD/MM/YY HH:mm", disabled=True, width="small"),
+            },
+            use_container_width=True, hide_index=True, key=editor_key
+        )
+
+        # UPDATE LOGIC (pakai delta edited_rows, commit sekali lewat tombol Save)
+        updates, deletes = build_issue_changes(filtered_issues, st.session_state.get(editor_key, {}),
+                                               st.session_state.user['username'])
+        c_pending, c_discard, c_save = st.columns([3, 1, 1], vertical_alignment="center")
+        with c_pending:
+            if updates or deletes:
+                st.caption(f"Unsaved: {len(updates)} edited, {len(deletes)} to delete")
+        with c_discard:
+            if st.button("Discard", use_container_width=True, disabled=not (updates or deletes)):
+                st.session_state.editor_rev += 1
+                st.rerun(scope="fragment")
+        with c_save:
+            if st.button("Save changes", use_container_width=True, type="primary", disabled=not (updates or deletes)):
+                with st.spinner("Saving..."):
+                    gone = commit_issue_changes(project, updates, deletes)
+                st.session_state.editor_rev += 1
+                saved = f"Changes Saved! ({len(updates) - gone} updated, {len(deletes)} deleted)"
+                if gone:
+                    saved += f" · {gone} issue(s) were deleted by someone else and skipped"
+                st.session_state.notification_queue = (saved, "success")
+                st.rerun()
+
+    # --- LIVE SYNC (FRAGMENT: tarik delta tiap SYNC_INTERVAL, rerun penuh hanya kalau ada perubahan) ---
+    @st.fragment(run_every=SYNC_INTERVAL)
+    @traced_fragment("live sync", polled=True)
+    def live_sync(project):
+        store = issue_store(project)
+        store.sync()
+        seen_key = f"seen_version_{project}"
+        # Rerun penuh akan menutup dialog Issue Detail: tunda sampai dialognya ditutup
+        if st.session_state.get(seen_key) != store.version and not st.session_state.get("detail_open"):
+            st.session_state[seen_key] = store.version
+            st.rerun()
+
+    # --- DETAILS (FRAGMENT: memilih issue tidak me-rerun tabel) ---
+    @st.fragment
+    @traced_fragment("details")
+    def details_fragment(project, search, filters):
+        render_header("Detail.svg", "Details", size=20)
+        
+        # Top-K hasil search/filter yang sama dengan Issue Log (frame sudah urut terbaru dulu); value = id
+        view = filter_issue_frame(issue_frame(project), project, search, filters)
+        results = view.head(SEARCH_TOP_K).reset_index()[['id', 'category', 'description']].to_dict("records")
+        labels = {i['id']: f"{i['id']} - {i.get('category') or 'No Category'} - {i['description']}" for i in results}
+        sel = st.selectbox("Select", [None] + list(labels), format_func=lambda i: labels.get(i, "-- Select --"),
+                           label_visibility="collapsed")
+        if len(results) == SEARCH_TOP_K:
+            st.caption(f"Showing the {SEARCH_TOP_K} newest matches. Refine the search to narrow down.")
+        
+        if st.button("View Detail", use_container_width=True, type="primary"):
+            if sel:
+                st.session_state.detail_open = sel
+                show_issue_detail(sel)
+
+    # --- DELETE PROGRESS (FRAGMENT, polling selama ada job) ---
+    @st.fragment(run_every=2)
+    @traced_fragment("delete progress", polled=True)
+    def delete_progress_panel():
+        seen = st.session_state.setdefault("deleting_projects", set())
+        for project, job in list(delete_jobs.items()):
+            if job["status"] == "running":
+                seen.add(project)
+                st.progress(min(1.0, job["issues"] / job["total"]) if job["total"] else 0.0,
+                            text=f"Deleting '{project}': {job['issues']}/{job['total']} issues, {job['objects']} files")
+            elif job["status"] == "failed":
+                st.error(f"Delete '{project}' failed: {job['error']}")
+                if st.button("Retry", key=f"retry_del_{project}", use_container_width=True):
+                    start_project_delete(project)
+                    st.rerun(scope="fragment")
+            elif project in seen:
+                # Job selesai: rerun penuh supaya daftar project ikut ter-update
+                seen.discard(project)
+                st.session_state.notification_queue = (f"Project '{project}' & issues deleted!", "success")
+                st.rerun()
+
+    # --- PERFORMANCE PANEL (ADMIN): trace terbaru dari semua session + statistik cache ---
+    def perf_panel():
+        trace_settings["sample_rate"] = st.slider("Sample rate (non-admin reruns)", 0.0, 1.0,
+                                                  float(trace_settings["sample_rate"]), 0.01, key="perf_sample_rate")
+        st.caption("Admin reruns are always traced. The current rerun shows up on the next one.")
+
+        traces = list(trace_log)[::-1]
+        if traces:
+            st.dataframe(pd.DataFrame([{
+                "at": format_wib(t["at"]), "user": t["user"] or "-", "kind": t["kind"], "status": t["status"],
+                "ms": t["ms"], "queries": t["queries"], "db ms": t["db_ms"], "KB": round(t["bytes"] / 1024, 1),
+            } for t in traces]), hide_index=True, use_container_width=True, height=220)
+
+            pick = st.selectbox("Trace", range(len(traces)), key="perf_trace",
+                                format_func=lambda i: f"{traces[i]['kind']} · {traces[i]['ms']} ms · {traces[i]['user'] or '-'}")
+            trace = traces[pick]
+            if trace["calls"]:
+                st.dataframe(pd.DataFrame.from_dict(trace["calls"], orient="index").sort_values("ms", ascending=False),
+                             use_container_width=True)
+            if trace["sections"]:
+                st.dataframe(pd.Series(trace["sections"], name="ms").sort_values(ascending=False), use_container_width=True)
+        else:
+            st.caption("No traces yet.")
+
+        st.dataframe(pd.DataFrame({"query": query_cache.stats(), "export": export_cache.stats(),
+                                   "session": session_cache.stats()}).T, use_container_width=True)
+
     # --- SIDEBAR ---
     with st.sidebar:
         render_header("Logo.svg", "TST v2", size=32)
         st.caption(f"Logged in as: {st.session_state.user.get('fullname', st.session_state.user.get('username'))}")
 
         if st.button("Logout", use_container_width=True):
+            if st.session_state.session_token:
+                revoke_session(st.session_state.session_token)
             st.session_state.user = None
+            st.session_state.session_token = None
             st.query_params.clear()
             st.rerun()
 
@@ -289,6 +1762,7 @@ else:
             if st.button("Create Project", use_container_width=True):
                 if np and np not in projects_list:
                     conn.table("projects").insert({"name": np}).execute()
+                    invalidate_project(np)
                     st.session_state.notification_queue = (f"Project '{np}' Created!", "success")
                     st.rerun()
                 elif np in projects_list:
@@ -301,165 +1775,160 @@ else:
 
             if st.button("Confirm Delete", use_container_width=True):
                 if del_proj != "-- Select --":
-                    with st.spinner("Deleting..."):
-                        conn.table("issues").delete().eq("project", del_proj).execute() 
-                        conn.table("projects").delete().eq("name", del_proj).execute()  
-                    
-                    st.session_state.notification_queue = (f"Project '{del_proj}' & issues deleted!", "success")
+                    start_project_delete(del_proj)
+                    st.session_state.notification_queue = (f"Deleting project '{del_proj}' in background...", "success")
                     st.rerun()
 
+        if any(j["status"] in ("running", "failed") for j in delete_jobs.values()):
+            delete_progress_panel()
+
         st.markdown("---")
-        if selected_nav != "All Projects (Dashboard)" and all_issues:
-            df_all = pd.DataFrame(all_issues)
-            if not df_all.empty:
-                buf = io.BytesIO()
-                with pd.ExcelWriter(buf, engine='xlsxwriter') as writer:
-                    df_all.to_excel(writer, index=False, sheet_name="Backup")
-                st.download_button("Export to Excel", data=buf, file_name="TST_Full.xlsx", use_container_width=True)
-        else:
-            st.button("Export to Excel", disabled=True, use_container_width=True)
+        # EXPORT: file hanya dibuat saat diminta, lalu di-cache sampai data berubah
+        with st.popover("Export", use_container_width=True):
+            exp_options = ["All Projects"] + projects_list
+            exp_proj = st.selectbox("Export Project", exp_options,
+                                    index=exp_options.index(selected_nav) if selected_nav in exp_options else 0)
+            exp_fmt = st.radio("Format", list(EXPORT_FORMATS), horizontal=True)
+            exp_dates = st.date_input("Found between (optional)", value=(), format="DD/MM/YYYY")
+            exp_project = None if exp_proj == "All Projects" else exp_proj
+            exp_range = tuple(exp_dates) if len(exp_dates) == 2 else None
+            ext, mime = EXPORT_FORMATS[exp_fmt]
 
-    # --- MAIN CONTENT ---
-    if st.session_state.active_ticket_id:
-        show_issue_detail(st.session_state.active_ticket_id)
-        st.session_state.active_ticket_id = None
+            exp_data = export_cache.peek(export_key(exp_project, exp_fmt, exp_range))
+            if exp_data is None:
+                if st.button("Generate Export", use_container_width=True):
+                    with st.spinner("Exporting..."):
+                        build_export(exp_project, exp_fmt, exp_range)
+                    st.rerun()
+            else:
+                st.download_button(f"Download .{ext}", data=exp_data, mime=mime, on_click="ignore",
+                                   file_name=f"TST_{exp_proj.replace(' ', '_')}.{ext}", use_container_width=True)
 
+        if is_admin(st.session_state.user):
+            st.markdown("---")
+            with st.expander("Performance"):
+                perf_panel()
+
+    # --- MAIN CONTENT ---
     if selected_nav == "All Projects (Dashboard)":
+        trace_checkpoint("dashboard")
         render_header("Dashboard.svg", "Global Dashboard", size=28)
-        filtered_issues = all_issues
+        rollup = dashboard_rollups(projects_list)
 
-        m1, m2, m3, m4 = st.columns(4)
+        m1, m2, m3, m4, m5 = st.columns(5)
         with m1:
-            with st.container(border=True): st.metric("Total Issues", len(filtered_issues))
+            with st.container(border=True): st.metric("Total Issues", rollup["total"])
         with m2:
-            with st.container(border=True): st.metric("Pending", len([i for i in filtered_issues if not i['status']]))
+            with st.container(border=True): st.metric("Pending", rollup["pending"])
         with m3:
-            with st.container(border=True): st.metric("Resolved", len([i for i in filtered_issues if i['status']]))
+            with st.container(border=True): st.metric("Resolved", rollup["resolved"])
         with m4:
-            with st.container(border=True): st.metric("High Severity", len([i for i in filtered_issues if i['severity'] in ["High"] and not i['status']]))
+            with st.container(border=True): st.metric("High Severity", rollup["high"])
+        with m5:
+            with st.container(border=True): st.metric(f"MTTR ({TREND_DAYS}d)", rollup["mttr"])
 
         st.write("")
+        st.markdown(f"**Opened vs Resolved (last {TREND_DAYS} days)**")
+        st.line_chart(rollup["trend"], height=260)
+
+        c_proj, c_sev = st.columns([3, 2])
+        with c_proj:
+            st.markdown("**Per Project**")
+            st.dataframe(rollup["by_project"], use_container_width=True)
+        with c_sev:
+            st.markdown("**Open by Severity**")
+            if rollup["by_severity"].empty: st.caption("No open issues.")
+            else: st.bar_chart(rollup["by_severity"], height=260)
+
+        c_rep, c_res = st.columns(2)
+        with c_rep:
+            st.markdown("**Top Reporters**")
+            st.dataframe(rollup["reporters"].rename("Reported"), use_container_width=True)
+        with c_res:
+            st.markdown("**Top Resolvers**")
+            st.dataframe(rollup["resolvers"].rename("Resolved"), use_container_width=True)
+
         st.info("Select a project from the sidebar to manage issues.")
 
     else:
         # PROJECT VIEW
-        filtered_issues = [i for i in all_issues if i['project'] == selected_nav]
+        trace_checkpoint("project view")
         render_header("Project.svg", selected_nav, size=28)
+        frame = issue_frame(selected_nav)
+        st.session_state[f"seen_version_{selected_nav}"] = issue_store(selected_nav).version
+        live_sync(selected_nav)
+
+        metrics = issue_metrics(frame)
+        total_count = metrics["total"]
 
         c1, c2, c3, c4 = st.columns(4)
-        c1.metric("Total", len(filtered_issues))
-        c2.metric("Pending", len([i for i in filtered_issues if not i['status']]))
-        c3.metric("Resolved", len([i for i in filtered_issues if i['status']]))
-        c4.metric("High Sev", len([i for i in filtered_issues if i['severity'] in ["High", "Critical"] and not i['status']]))
+        c1.metric("Total", total_count)
+        c2.metric("Pending", metrics["pending"])
+        c3.metric("Resolved", metrics["resolved"])
+        c4.metric("High Sev", metrics["high"])
 
         st.markdown("---")
 
-        # --- QUICK ADD (Layout Dirapikan) ---
-        with st.container(border=True):
-            render_header("Add.svg", "Quick Add Issue", size=20)
-            
-            # Baris 1: Desc & Remarks (Seimbang 1:1)
-            c_desc, c_rem = st.columns([1, 1]) 
-            with c_desc: desc_in = st.text_input("Desc", label_visibility="collapsed", placeholder="Bug description...")
-            with c_rem: rem_in = st.text_input("Rem", label_visibility="collapsed", placeholder="Expected behavior...")
-            
-            # Baris 2: Severity & Category (Seimbang 1:1)
-            c_sev, c_cat = st.columns([1, 1])
-            with c_sev: sev_in = st.selectbox("Severity", ["Low", "Medium", "High"], label_visibility="collapsed")
-            with c_cat: cat_in = st.selectbox("Category", CATEGORY_OPTIONS, label_visibility="collapsed")
-            
-            # Baris 3: Uploader & Tombol (Sejajar)
-            c_up_btn, c_submit = st.columns([4, 1], vertical_alignment="center")
-            with c_up_btn: 
-                uploaded_file = st.file_uploader("Evidence", type=['png', 'jpg', 'jpeg'], label_visibility="collapsed")
-            with c_submit:
-                # Tombol akan otomatis sejajar karena vertical_alignment="bottom" dan trik CSS
-                if st.button("Submit Issue", use_container_width=True, type="primary"):
-                    if desc_in:
-                        with st.spinner("Submitting..."):
-                            evidence_url = upload_evidence(uploaded_file)
-                            new_id = f"#T-{len(all_issues)+1:03d}"
-                            conn.table("issues").insert({
-                                "id": new_id, "project": selected_nav, "description": desc_in, "remarks": rem_in,
-                                "severity": sev_in, "category": cat_in, "status": False, "time_found": get_wib_time(),
-                                "time_resolved": "-", "reporter": st.session_state.user['username'], "comments": [], "evidence": evidence_url 
-                            }).execute()
-                            
-                            st.session_state.notification_queue = ("Issue Created!", "success")
-                            st.rerun()
-
+        quick_add_fragment(selected_nav)
+        import_fragment(selected_nav)
         st.write("")
 
         # --- ISSUE LOG (TABLE) ---
-        if filtered_issues:
+        if total_count:
             render_header("ListTable.svg", "Issue Log", size=22)
-            df = pd.DataFrame(filtered_issues)
-            df['delete'] = False
-            df = df.rename(columns={'description': 'desc'})
-            
-            if 'category' not in df.columns:
-                df['category'] = 'Backend Logic'
-
-            df_display = df[['delete', 'status', 'id', 'time_found', 'desc', 'remarks', 'category', 'severity', 'time_resolved']]
-
-            res = st.data_editor(
-                df_display,
-                column_config={
-                    "delete": st.column_config.CheckboxColumn("Del", width="small"),
-                    "status": st.column_config.CheckboxColumn("Done", width="small"),
-                    "id": st.column_config.TextColumn("ID", width="small", disabled=True),
-                    "desc": st.column_config.TextColumn("Description", width="large"),
-                    "remarks": st.column_config.TextColumn("Remarks", width="medium"),
-                    "category": st.column_config.SelectboxColumn("Category", options=CATEGORY_OPTIONS, required=True), 
-                    "severity": st.column_config.SelectboxColumn("Severity", options=["Low", "Medium", "High", "Critical"], required=True),
-                    "time_found": st.column_config.TextColumn("Found", disabled=True, width="small"),
-                    "time_resolved": st.column_config.TextColumn("Resolved", disabled=True, width="small"),
-                },
-                use_container_width=True, hide_index=True, key="editor"
-            )
-
-            # UPDATE LOGIC
-            if not res.equals(df_display):
-                for index, row in res.iterrows():
-                    issue_id = row['id']
-                    orig_row = df_display[df_display['id'] == issue_id].iloc[0]
-
-                    if row['delete']:
-                        conn.table("issues").delete().eq("id", issue_id).execute()
-                        st.session_state.notification_queue = ("Issue Deleted!", "success")
-                        st.rerun()
-                        break
-
-                    updates = {}
-                    if row['status'] != orig_row['status']:
-                        updates['status'] = row['status']
-                        if row['status'] == True:
-                            updates['time_resolved'] = get_wib_time()
-                            updates['resolved_by'] = st.session_state.user['username']
-                        else:
-                            updates['time_resolved'] = "-"
-                            updates['resolved_by'] = None
 
-                    if row['desc'] != orig_row['desc']: updates['description'] = row['desc']
-                    if row['remarks'] != orig_row['remarks']: updates['remarks'] = row['remarks']
-                    if row['severity'] != orig_row['severity']: updates['severity'] = row['severity']
-                    if row['category'] != orig_row['category']: updates['category'] = row['category']
+            # SEARCH & FILTER: dipakai bersama oleh Issue Log dan Details (query di Supabase)
+            f_search, f_sev, f_cat, f_status, f_rep, f_date = st.columns([2, 1, 1, 1, 1, 1.2])
+            # live: commit setelah jeda mengetik (debounce), bukan tiap ketukan dan tidak menunggu Enter
+            with f_search: search = st.text_input("Search", key=f"flt_search_{selected_nav}", label_visibility="collapsed",
+                                                   placeholder="Search description, remarks, comments or #T-id...",
+                                                   type="search", live="400ms")
+            with f_sev: sev_filter = st.multiselect("Severity", SEVERITY_OPTIONS, key=f"flt_sev_{selected_nav}",
+                                                   label_visibility="collapsed", placeholder="Severity")
+            with f_cat: cat_filter = st.multiselect("Category", CATEGORY_OPTIONS, key=f"flt_cat_{selected_nav}",
+                                                   label_visibility="collapsed", placeholder="Category")
+            with f_status: status_filter = st.selectbox("Status", ["All", "Pending", "Resolved"], key=f"flt_status_{selected_nav}",
+                                                        label_visibility="collapsed")
+            with f_rep: rep_filter = st.multiselect("Reporter", fetch_usernames(), key=f"flt_rep_{selected_nav}",
+                                                   label_visibility="collapsed", placeholder="Reporter")
+            with f_date: date_filter = st.date_input("Found between", value=(), key=f"flt_date_{selected_nav}",
+                                                     label_visibility="collapsed", format="DD/MM/YYYY")
 
-                    if updates:
-                        conn.table("issues").update(updates).eq("id", issue_id).execute()
-                        st.session_state.notification_queue = ("Changes Saved!", "success")
-                        st.rerun()
+            filters = {}
+            if sev_filter: filters['severity'] = sev_filter
+            if cat_filter: filters['category'] = cat_filter
+            if status_filter != "All": filters['status'] = status_filter == "Resolved"
+            if rep_filter: filters['reporter'] = rep_filter
+            if len(date_filter) == 2: filters['found_range'] = tuple(date_filter)
+            match_count = len(filter_issue_frame(frame, selected_nav, search, filters))
+            if search.strip():
+                # Search hanya menarik top-K dari Postgres; jumlah semua match dari count="exact"
+                _, search_total = search_issue_ids(selected_nav, search.strip(), filters)
+                if search_total > match_count:
+                    st.caption(f"Showing the {match_count} newest of {search_total} matches. Refine the search to narrow down.")
 
-            # --- VIEW DETAIL SECTION (FIXED POSITION) ---
-            st.write("")
-            st.markdown("---")
-            render_header("Detail.svg", "Details", size=20)
-            
-            opts = ["-- Select --"] + [f"{i['id']} - {i.get('category', 'No Category')} - {i['description']}" for i in filtered_issues]
-            sel = st.selectbox("Select", opts, label_visibility="collapsed")
-            
-            if st.button("View Detail", use_container_width=True, type="primary"):
-                if sel != "-- Select --":
-                    show_issue_detail(sel.split(" - ")[0])
+            if match_count:
+                # PAGING: frame project sudah di memory, yang dirender hanya halaman aktif (ganti halaman = rerun penuh)
+                total_pages = max(1, -(-match_count // PAGE_SIZE))
+                page_key = f"page_{selected_nav}"
+                if st.session_state.get(page_key, 1) > total_pages:
+                    st.session_state[page_key] = total_pages
+                c_info, c_page = st.columns([4, 1], vertical_alignment="center")
+                with c_page:
+                    page = st.number_input("Page", min_value=1, max_value=total_pages,
+                                           key=page_key, label_visibility="collapsed") - 1
+                with c_info:
+                    st.caption(f"Page {page + 1} of {total_pages} ({match_count} of {total_count} issues)")
+
+                issue_log_fragment(selected_nav, page, search, filters)
+
+                # --- VIEW DETAIL SECTION (FIXED POSITION) ---
+                st.write("")
+                st.markdown("---")
+                details_fragment(selected_nav, search, filters)
+            else:
+                st.info("No issues match the current search/filters.")
         else:
-            st.info("No issues yet.")
\ No newline at end of file
+            st.info("No issues yet.")
+
+finish_trace(rerun_trace)
@@ -0,0 +1,149 @@
+# Generator data sintetis untuk backend SQLite (issue, komentar, evidence stub, user, project).
+#
+#   python -m bench.generate --issues 100000 --out bench/data/100k.sqlite
+#   TST_BACKEND=sqlite TST_SQLITE_PATH=bench/data/100k.sqlite streamlit run TST_V2.py
+#
+# Semua user memakai password BENCH_PASSWORD (hash PBKDF2 format TST_V2.hash_password), user01 admin.
+import argparse
+import ast
+import base64
+import hashlib
+import io
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from bench.backend import SQLiteBackend, format_issue_id
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "TST_V2.py")
+
+
+def app_constants(*names):
+    # TST_V2.py script Streamlit (import = menjalankan app): ambil nilai literal-nya dari AST
+    with open(APP, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    values = {node.targets[0].id: ast.literal_eval(node.value) for node in tree.body
+              if isinstance(node, ast.Assign) and len(node.targets) == 1
+              and isinstance(node.targets[0], ast.Name) and node.targets[0].id in names}
+    return [values[name] for name in names]
+
+
+BENCH_PASSWORD = "bench"
+# Sama persis dengan dropdown app, supaya filter kategori/severity di benchmark mengenai data
+SEVERITIES, CATEGORIES = app_constants("SEVERITY_OPTIONS", "CATEGORY_OPTIONS")
+SEVERITY_WEIGHTS = [40, 35, 18, 7]
+WORDS = ("login button error crash timeout page form save load export report user profile payment cart "
+         "search filter upload image layout mobile slow blank invalid missing wrong data table menu").split()
+INSERT_BATCH = 5000
+
+
+def password_hash(password, iterations=310000):
+    salt = hashlib.sha256(b"tst-bench").digest()[:16]
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
+    return f"pbkdf2_sha256${iterations}${base64.b64encode(salt).decode()}${base64.b64encode(digest).decode()}"
+
+
+def stub_image(seed):
+    # Evidence stub: WebP kecil, isi berbeda per seed (nama object = hash isi, seperti app)
+    from PIL import Image
+    buf = io.BytesIO()
+    Image.new("RGB", (8, 8), (seed * 37 % 256, seed * 91 % 256, seed * 53 % 256)).save(buf, format="WEBP")
+    return buf.getvalue()
+
+
+def sentence(rng, n):
+    return " ".join(rng.choice(WORDS) for _ in range(n))
+
+
+def generate(backend=None, issues=1000, projects=5, users=20, comments=3.0, evidence=0.3,
+             days=180, seed=0, log=print):
+    # comments = rata-rata komentar per issue, evidence = fraksi issue yang punya gambar
+    backend = backend or SQLiteBackend()
+    rng = random.Random(seed)
+    db = backend.db
+    now = datetime.now(timezone.utc)
+    started = time.perf_counter()
+
+    project_names = [f"Project {i + 1:02d}" for i in range(projects)]
+    usernames = [f"user{i + 1:02d}" for i in range(users)]
+    hashed = password_hash(BENCH_PASSWORD)
+    with backend.transaction():
+        db.executemany("insert into projects (name) values (?)", [(p,) for p in project_names])
+        db.executemany("insert into users (username, password_hash, fullname, is_admin) values (?, ?, ?, ?)",
+                       [(u, hashed, u.title(), int(i == 0)) for i, u in enumerate(usernames)])
+
+    # Evidence: pool object kecil, dipakai bersama oleh banyak issue (dedupe by hash seperti app)
+    bucket = backend.client.storage.from_("evidence")
+    pool = []
+    for i in range(min(64, max(1, int(issues * evidence)))):
+        data = stub_image(i)
+        digest = hashlib.sha256(data).hexdigest()
+        backend.objects[("evidence", f"{digest}.webp")] = data
+        backend.objects[("evidence", f"thumbs/{digest}.webp")] = data
+        pool.append((bucket.get_public_url(f"{digest}.webp"), bucket.get_public_url(f"thumbs/{digest}.webp")))
+
+    issue_rows, comment_rows = [], []
+
+    def flush():
+        with backend.transaction():
+            db.executemany(
+                "insert into issues (id, project, reporter, status, found_at, description, remarks, category, "
+                "severity, resolved_at, resolved_by, evidence, evidence_thumb, comments, updated_at) "
+                "values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, '[]', ?)", issue_rows)
+            db.executemany("insert into issue_comments (issue_id, username, msg, time, created_at) "
+                           "values (?, ?, ?, ?, ?)", comment_rows)
+        issue_rows.clear()
+        comment_rows.clear()
+
+    for n in range(1, issues + 1):
+        found = now - timedelta(seconds=rng.uniform(0, days * 86400))
+        resolved = rng.random() < 0.6
+        resolved_at = min(found + timedelta(hours=rng.expovariate(1 / 36)), now) if resolved else None
+        thumb = rng.choice(pool) if rng.random() < evidence else (None, None)
+        issue_id = format_issue_id(n)
+        issue_rows.append((
+            issue_id, rng.choice(project_names), rng.choice(usernames), int(resolved), found.isoformat(timespec="microseconds"),
+            sentence(rng, rng.randint(4, 12)), sentence(rng, rng.randint(0, 8)), rng.choice(CATEGORIES),
+            rng.choices(SEVERITIES, SEVERITY_WEIGHTS)[0], resolved_at.isoformat(timespec="microseconds") if resolved_at else None,
+            rng.choice(usernames) if resolved else None, thumb[0], thumb[1],
+            (resolved_at or found).isoformat(timespec="microseconds"),
+        ))
+        for c in range(int(rng.expovariate(1 / comments)) if comments else 0):
+            at = found + timedelta(minutes=15 * (c + 1))
+            comment_rows.append((issue_id, rng.choice(usernames), sentence(rng, rng.randint(3, 15)),
+                                 (at + timedelta(hours=7)).strftime("%d/%m %H:%M"), at.isoformat(timespec="microseconds")))
+        if len(issue_rows) == INSERT_BATCH:
+            flush()
+            if n % (INSERT_BATCH * 20) == 0:
+                log(f"  {n} issues ({time.perf_counter() - started:.0f}s)")
+    if issue_rows:
+        flush()
+
+    backend.sync_sequence()
+    db.execute("delete from issue_tombstones")
+    db.execute("analyze")
+    log(f"Generated {issues} issues, {db.execute('select count(*) from issue_comments').fetchone()[0]} comments, "
+        f"{len(backend.objects)} evidence objects in {time.perf_counter() - started:.1f}s")
+    return backend
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic TST data into a SQLite file.")
+    parser.add_argument("--issues", type=int, default=10000)
+    parser.add_argument("--projects", type=int, default=5)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--comments", type=float, default=3.0, help="average comments per issue")
+    parser.add_argument("--evidence", type=float, default=0.3, help="fraction of issues with evidence")
+    parser.add_argument("--days", type=int, default=180, help="spread found_at over the last N days")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", required=True)
+    args = parser.parse_args()
+    backend = generate(issues=args.issues, projects=args.projects, users=args.users, comments=args.comments,
+                       evidence=args.evidence, days=args.days, seed=args.seed)
+    backend.save(args.out)
+    print(f"Saved to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
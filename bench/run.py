@@ -0,0 +1,288 @@
+# Benchmark TST_V2.py di atas backend SQLite + data sintetis, lewat streamlit AppTest.
+#
+#   python -m bench.run --issues 10000                       # jalankan & tampilkan hasil
+#   python -m bench.run --issues 10000 --save-baseline       # simpan sebagai baseline
+#   python -m bench.run --issues 10000 --data bench/data/10k.sqlite --out result.json
+#
+# Tiap skenario mulai dari salinan data yang sama dan cache Streamlit yang kosong. Yang diukur
+# hanya rerun dari interaksi user (klik/pilih), bukan langkah persiapannya:
+#   latency  = median wall time rerun (tanpa tracemalloc)
+#   peak     = puncak alokasi Python selama rerun (satu run terpisah dengan tracemalloc), dikurangi
+#              puncak rerun tanpa aksi sesudahnya di AppTest yang sama (overhead tetap AppTest);
+#              bytecode script di-cache lintas run seperti di server, compile tidak ikut terukur
+#   queries  = jumlah request ke backend (table/rpc/storage) selama rerun
+# Exit code 1 kalau ada regresi terhadap baseline (lihat is_regression).
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "TST_V2.py")
+DEFAULT_BASELINE = os.path.join(ROOT, "bench", "baseline.json")
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+os.environ["TST_BACKEND"] = "sqlite"
+os.environ.setdefault("TST_TRACE_SAMPLE", "0")  # tracing app mati saat benchmark (kecuali diminta)
+
+import streamlit as st
+import streamlit.logger
+from streamlit import config
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1 import element_tree
+from streamlit.testing.v1 import local_script_runner
+
+from bench import backend as bench_backend
+from bench.generate import BENCH_PASSWORD, generate
+
+TIMEOUT = 600
+TOLERANCE = 0.25
+MIN_LATENCY_DELTA_MS = 25
+MIN_PEAK_DELTA_MB = 2
+BENCH_USER = "user02"  # bukan admin: rerun admin selalu di-trace, angka jadi tidak sebanding
+LOG_LEVEL = os.environ.get("BENCH_LOG_LEVEL", "error")  # warning deprecation dsb. dari app tidak ikut tercetak
+
+
+# --- DATA EDITOR: AppTest belum bisa mengisi st.data_editor, state-nya disuntik langsung ---
+_editor_states = {}
+_get_widget_states = element_tree.ElementTree.get_widget_states
+
+
+def _get_widget_states_with_editors(self):
+    states = _get_widget_states(self)
+    for widget_id, value in _editor_states.items():
+        state = WidgetState(id=widget_id)
+        state.string_value = value
+        states.widgets.append(state)
+    return states
+
+
+element_tree.ElementTree.get_widget_states = _get_widget_states_with_editors
+
+
+# --- BYTECODE: AppTest meng-compile ulang script tiap run (server asli cache sekali per proses) ---
+# Compile TST_V2.py sendiri ~7 MB alokasi di awal tiap rerun dan menutupi puncak workload
+_script_cache = ScriptCache()
+local_script_runner.ScriptCache = lambda: _script_cache
+
+
+def edit_data_editor(at, key_prefix, edited_rows):
+    widget_id = next(n.proto.id for n in at.dataframe if key_prefix in (n.proto.id or ""))
+    _editor_states[widget_id] = json.dumps({"edited_rows": edited_rows, "added_rows": [], "deleted_rows": []})
+
+
+def button(at, label):
+    return next(b for b in at.button if b.label == label)
+
+
+# --- SKENARIO: setup(at) lalu kembalikan aksi yang diukur ---
+def login(at, project):
+    at.run()
+    at.text_input[0].input(BENCH_USER)
+    at.text_input[1].input(BENCH_PASSWORD)
+    return button(at, "Sign In").click
+
+
+def logged_in(at):
+    at.session_state["user"] = {"username": BENCH_USER, "fullname": BENCH_USER.title()}
+
+
+def dashboard(at, project):
+    logged_in(at)
+    return lambda: None
+
+
+def dashboard_rerun(at, project):
+    logged_in(at)
+    at.run()
+    return lambda: None
+
+
+def project_view(at, project):
+    logged_in(at)
+    at.run()
+    return lambda: at.sidebar.selectbox[0].select(project)
+
+
+def project_rerun(at, project):
+    project_view(at, project)()
+    at.run()
+    return lambda: None
+
+
+def editor_save(at, project):
+    project_view(at, project)()
+    at.run()
+    edit_data_editor(at, f"editor_{project}_", {"0": {"status": True}, "1": {"remarks": "bench edit"},
+                                                 "2": {"severity": "Critical"}})
+    at.run()
+    return button(at, "Save changes").click
+
+
+def comment_send(at, project):
+    project_view(at, project)()
+    at.run()
+    select = next(s for s in at.main.selectbox if s.label == "Select")
+    issue_id = select.options[1].split(" - ", 1)[0]
+    select.set_value(issue_id)
+    button(at, "View Detail").click()
+    at.run()
+    def send():
+        at.text_input(key=f"txt_{issue_id}").input("benchmark comment")
+        at.button(key=f"snd_{issue_id}").click()
+    return send
+
+
+def export(at, project):
+    logged_in(at)
+    at.run()
+    at.sidebar.radio[0].set_value("Excel")
+    at.run()
+    return next(b for b in at.sidebar.button if b.label == "Generate Export").click
+
+
+SCENARIOS = {
+    "login": login,
+    "dashboard": dashboard,
+    "dashboard (rerun)": dashboard_rerun,
+    "project view": project_view,
+    "project view (rerun)": project_rerun,
+    "editor save": editor_save,
+    "comment send": comment_send,
+    "export": export,
+}
+
+
+def run_scenario(name, template, project, traced=False):
+    backend = bench_backend.install(template.clone())
+    st.cache_resource.clear()
+    st.cache_data.clear()
+    _editor_states.clear()
+
+    at = AppTest.from_file(APP, default_timeout=TIMEOUT)
+    action = SCENARIOS[name](at, project)
+    action()
+
+    backend.stats.reset()
+    if traced:
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+    started = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1] if traced else None
+    if traced:
+        tracemalloc.stop()
+
+    if at.exception:
+        raise RuntimeError(f"{name}: {at.exception[0].message}")
+    stats = backend.stats.snapshot()
+    if traced:
+        # Tracking baru: memory yang ditahan workload (cache dsb.) tidak ikut terhitung di baseline
+        tracemalloc.start()
+        at.run()
+        peak = max(0, peak - tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return elapsed, peak, stats
+
+
+def run_suite(template, project, repeat, only=None, log=print):
+    results = {}
+    for name in SCENARIOS:
+        if only and name not in only:
+            continue
+        latencies = []
+        for _ in range(repeat):
+            elapsed, _, stats = run_scenario(name, template, project)
+            latencies.append(elapsed)
+        _, peak, _ = run_scenario(name, template, project, traced=True)
+        results[name] = {
+            "latency_ms": round(statistics.median(latencies) * 1000, 1),
+            "peak_mb": round(peak / 2**20, 2),
+            "queries": stats["queries"],
+            "rows": stats["rows"],
+            "db_ms": stats["db_ms"],
+            "calls": stats["calls"],
+        }
+        log(f"  {name:<22} {results[name]['latency_ms']:>9.1f} ms {results[name]['peak_mb']:>9.2f} MB "
+            f"{stats['queries']:>5} queries {stats['rows']:>8} rows")
+    return results
+
+
+def is_regression(metric, current, baseline, tolerance):
+    if metric == "queries":
+        return current > baseline
+    floor = MIN_LATENCY_DELTA_MS if metric == "latency_ms" else MIN_PEAK_DELTA_MB
+    return current > baseline * (1 + tolerance) and current - baseline > floor
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        for metric in ("latency_ms", "peak_mb", "queries"):
+            if metric in base and is_regression(metric, current[metric], base[metric], tolerance):
+                regressions.append(f"{name}: {metric} {base[metric]} -> {current[metric]}")
+    return regressions
+
+
+def main():
+    config.get_config_options()  # parse config sekarang, supaya level log tidak di-reset saat run pertama
+    streamlit.logger.set_log_level(LOG_LEVEL)
+    parser = argparse.ArgumentParser(description="Benchmark TST_V2.py reruns on synthetic data.")
+    parser.add_argument("--issues", type=int, default=10000)
+    parser.add_argument("--projects", type=int, default=5)
+    parser.add_argument("--comments", type=float, default=3.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--data", help="SQLite file from bench.generate (generated in memory if omitted)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="*", choices=list(SCENARIOS), help="run only these scenarios")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    parser.add_argument("--out", help="write results as JSON")
+    args = parser.parse_args()
+
+    if args.data:
+        template = bench_backend.SQLiteBackend(args.data)
+    else:
+        template = generate(issues=args.issues, projects=args.projects, comments=args.comments, seed=args.seed)
+    project = template.db.execute("select project from issues group by project order by count(*) desc limit 1").fetchone()[0]
+    total = template.db.execute("select count(*) from issues").fetchone()[0]
+
+    print(f"Benchmark: {total} issues, project '{project}', {args.repeat} runs per scenario")
+    results = run_suite(template, project, args.repeat, args.only)
+    report = {"issues": total, "project": project, "results": results}
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline to compare against (use --save-baseline).")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get("issues") != total:
+        print(f"Baseline was recorded with {baseline.get('issues')} issues; comparing anyway.")
+    regressions = compare(results, baseline["results"], args.tolerance)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    print("No regressions." if not regressions else f"{len(regressions)} regression(s).")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
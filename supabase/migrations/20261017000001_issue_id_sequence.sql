@@ -0,0 +1,22 @@
+-- Allocator ID issue "#T-NNN" di sisi server (atomic, aman untuk submit bersamaan)
+create sequence if not exists public.issue_id_seq;
+
+-- Mulai setelah ID terbesar yang sudah ada
+select setval(
+    'public.issue_id_seq',
+    coalesce((select max(substring(id from '^#T-([0-9]+)$')::bigint) from public.issues), 0) + 1,
+    false
+);
+
+create or replace function public.next_issue_id()
+returns text
+language sql
+volatile
+as $$
+    -- Minimal 3 digit; lpad memotong string yang lebih panjang, jadi panjangnya ikut angkanya (#T-1000)
+    select '#T-' || lpad(v::text, greatest(3, length(v::text)), '0')
+      from nextval('public.issue_id_seq') as v;
+$$;
+
+grant usage on sequence public.issue_id_seq to anon, authenticated;
+grant execute on function public.next_issue_id() to anon, authenticated;
@@ -0,0 +1,27 @@
+-- Komentar append-only: satu baris per pesan, bukan array JSON di issues.comments
+create table if not exists public.issue_comments (
+    id bigint generated always as identity primary key,
+    issue_id text not null references public.issues(id) on delete cascade,
+    username text not null,
+    msg text not null,
+    time text,                                  -- waktu tampilan (WIB), sama seperti format lama
+    created_at timestamptz not null default now()
+);
+
+-- Ambil N pesan terbaru / halaman sebelumnya per issue (keyset di id)
+create index if not exists issue_comments_issue_id_idx
+    on public.issue_comments (issue_id, id desc);
+
+-- Migrasi array lama, urutan pesan dipertahankan lewat identity id
+insert into public.issue_comments (issue_id, username, msg, time)
+select i.id, c.elem->>'user', coalesce(c.elem->>'msg', ''), c.elem->>'time'
+from public.issues i
+cross join lateral jsonb_array_elements(coalesce(i.comments, '[]'::jsonb)) with ordinality as c(elem, ord)
+where jsonb_typeof(i.comments) = 'array'
+  and not exists (select 1 from public.issue_comments x where x.issue_id = i.id)
+order by i.id, c.ord;
+
+-- Kolom issues.comments dibiarkan (read-only) untuk rollback; app tidak menulisnya lagi,
+-- jadi insert baru mengandalkan default-nya
+alter table public.issues alter column comments set default '[]';
+grant select, insert on public.issue_comments to anon, authenticated;
@@ -0,0 +1,2 @@
+-- URL thumbnail evidence (object thumbs/<sha256>.webp di bucket evidence)
+alter table public.issues add column if not exists evidence_thumb text;
@@ -0,0 +1,17 @@
+-- Password di-hash (PBKDF2, dihitung app) + session token opaque
+alter table public.users add column if not exists password_hash text;
+
+-- Kolom plaintext lama dikosongkan oleh app saat user login pertama kali setelah migrasi
+alter table public.users alter column password drop not null;
+
+create table if not exists public.user_sessions (
+    token_hash text primary key,                -- sha256(token); token asli hanya ada di URL user
+    username text not null references public.users(username) on delete cascade,
+    created_at timestamptz not null default now(),
+    expires_at timestamptz not null,
+    revoked_at timestamptz
+);
+
+create index if not exists user_sessions_username_idx on public.user_sessions (username);
+
+grant select, insert, update on public.user_sessions to anon, authenticated;
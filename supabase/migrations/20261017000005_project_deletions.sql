@@ -0,0 +1,16 @@
+-- Status job hapus project (background, per batch). Job "running"/"failed" dilanjutkan saat app start.
+create table if not exists public.project_deletions (
+    project text primary key,
+    status text not null default 'running' check (status in ('running', 'failed', 'done')),
+    total_issues integer not null default 0,
+    deleted_issues integer not null default 0,
+    deleted_objects integer not null default 0,
+    error text,
+    started_at timestamptz not null default now(),
+    updated_at timestamptz not null default now()
+);
+
+-- Batch delete: ambil N issue berikutnya per project
+create index if not exists issues_project_idx on public.issues (project);
+
+grant select, insert, update on public.project_deletions to anon, authenticated;
@@ -0,0 +1,37 @@
+-- Full-text search issue: description, remarks & isi diskusi (config 'simple', prefix match untuk typeahead)
+alter table public.issues add column if not exists comment_tsv tsvector not null default ''::tsvector;
+
+alter table public.issues add column if not exists search_tsv tsvector
+    generated always as (
+        to_tsvector('simple', coalesce(description, '') || ' ' || coalesce(remarks, '')) || comment_tsv
+    ) stored;
+
+create index if not exists issues_search_tsv_idx on public.issues using gin (search_tsv);
+
+-- Filter yang dipakai bersama search di Issue Log / Details
+create index if not exists issues_project_status_severity_idx on public.issues (project, status, severity);
+
+-- Update incremental: tiap komentar baru ditambahkan ke comment_tsv issue-nya
+create or replace function public.issue_comments_index()
+returns trigger
+language plpgsql
+as $$
+begin
+    update public.issues
+       set comment_tsv = comment_tsv || to_tsvector('simple', new.msg)
+     where id = new.issue_id;
+    return new;
+end;
+$$;
+
+drop trigger if exists issue_comments_index on public.issue_comments;
+create trigger issue_comments_index
+    after insert on public.issue_comments
+    for each row execute function public.issue_comments_index();
+
+-- Isi awal dari komentar yang sudah ada
+update public.issues i
+   set comment_tsv = c.tsv
+  from (select issue_id, to_tsvector('simple', string_agg(msg, ' ' order by id)) as tsv
+          from public.issue_comments group by issue_id) c
+ where c.issue_id = i.id;
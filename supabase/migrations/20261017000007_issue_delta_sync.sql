@@ -0,0 +1,56 @@
+-- Delta sync: tiap session/proses hanya menarik issue yang berubah sejak watermark terakhir
+alter table public.issues add column if not exists updated_at timestamptz not null default clock_timestamp();
+
+create or replace function public.issues_touch_updated_at()
+returns trigger
+language plpgsql
+as $$
+declare
+    ignored constant text[] := array['updated_at', 'comment_tsv', 'search_tsv'];
+begin
+    -- Komentar baru hanya mengubah comment_tsv (index search): bukan perubahan issue, jangan
+    -- sampai delta sync me-rerun semua session (dan menutup dialog) untuk tiap pesan chat
+    if (to_jsonb(new) - ignored) is not distinct from (to_jsonb(old) - ignored) then
+        return new;
+    end if;
+    new.updated_at := clock_timestamp();
+    return new;
+end;
+$$;
+
+drop trigger if exists issues_touch_updated_at on public.issues;
+create trigger issues_touch_updated_at
+    before update on public.issues
+    for each row execute function public.issues_touch_updated_at();
+
+create index if not exists issues_project_updated_at_idx on public.issues (project, updated_at);
+
+-- Tombstone untuk delete (row yang sudah hilang tidak bisa ditarik lewat updated_at)
+create table if not exists public.issue_tombstones (
+    id text not null,
+    project text not null,
+    deleted_at timestamptz not null default clock_timestamp()
+);
+
+create index if not exists issue_tombstones_project_deleted_at_idx on public.issue_tombstones (project, deleted_at);
+
+create or replace function public.issues_tombstone()
+returns trigger
+language plpgsql
+as $$
+begin
+    insert into public.issue_tombstones (id, project) values (old.id, old.project);
+    return old;
+end;
+$$;
+
+drop trigger if exists issues_tombstone on public.issues;
+create trigger issues_tombstone
+    after delete on public.issues
+    for each row execute function public.issues_tombstone();
+
+-- Tombstone lebih tua dari 1 hari boleh dibersihkan (mis. via pg_cron); app full-reload
+-- kalau watermark-nya lebih tua dari itu (SYNC_FULL_RELOAD_AFTER):
+--   delete from public.issue_tombstones where deleted_at < now() - interval '1 day';
+
+grant select on public.issue_tombstones to anon, authenticated;
@@ -0,0 +1,44 @@
+-- Model issue kanonik: status boolean, waktu timestamptz (bukan "dd/mm HH:MI" tanpa tahun, "-" = null)
+alter table public.issues alter column status set default false;
+update public.issues set status = false where status is null;
+alter table public.issues alter column status set not null;
+
+alter table public.issues add column if not exists found_at timestamptz;
+alter table public.issues add column if not exists resolved_at timestamptz;
+
+-- Migrasi string lama (jam WIB, tahun tidak disimpan): pakai tahun sekarang,
+-- mundur satu tahun kalau hasilnya jatuh di masa depan
+update public.issues
+   set found_at = case when ts > now() then ts - interval '1 year' else ts end
+  from (select id as tid,
+               (to_timestamp(time_found || ' ' || extract(year from now())::int, 'DD/MM HH24:MI YYYY')::timestamp
+                    at time zone 'Asia/Jakarta') as ts
+          from public.issues
+         where found_at is null and time_found ~ '^\d{2}/\d{2} \d{2}:\d{2}$') parsed
+ where id = parsed.tid;
+
+update public.issues
+   set resolved_at = case when ts > now() then ts - interval '1 year' else ts end
+  from (select id as tid,
+               (to_timestamp(time_resolved || ' ' || extract(year from now())::int, 'DD/MM HH24:MI YYYY')::timestamp
+                    at time zone 'Asia/Jakarta') as ts
+          from public.issues
+         where resolved_at is null and status and time_resolved ~ '^\d{2}/\d{2} \d{2}:\d{2}$') parsed
+ where id = parsed.tid;
+
+-- Resolve yang jatuh sebelum found (lintas tahun) digeser ke tahun berikutnya
+update public.issues set resolved_at = resolved_at + interval '1 year'
+ where resolved_at < found_at and resolved_at + interval '1 year' <= now();
+
+update public.issues set found_at = coalesce(found_at, updated_at, now()) where found_at is null;
+alter table public.issues alter column found_at set default now();
+alter table public.issues alter column found_at set not null;
+
+-- Query rentang waktu (filter "Found between", export, dashboard) pakai index ini
+create index if not exists issues_project_found_at_idx on public.issues (project, found_at);
+create index if not exists issues_resolved_at_idx on public.issues (resolved_at) where resolved_at is not null;
+
+-- time_found / time_resolved tidak ditulis lagi oleh app; dibiarkan untuk rollback,
+-- tapi tidak boleh NOT NULL lagi (insert baru tidak mengisinya)
+alter table public.issues alter column time_found drop not null;
+alter table public.issues alter column time_resolved drop not null;
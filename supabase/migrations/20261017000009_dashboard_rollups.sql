@@ -0,0 +1,115 @@
+-- Rollup untuk Global Dashboard, di-maintain incremental oleh trigger di issues.
+-- Dashboard membaca O(project x hari), bukan O(issue).
+
+create table if not exists public.issue_status_rollup (
+    project text not null,
+    severity text not null,
+    open_count integer not null default 0,
+    resolved_count integer not null default 0,
+    primary key (project, severity)
+);
+
+create table if not exists public.issue_daily_rollup (
+    project text not null,
+    day date not null,                          -- hari WIB
+    opened integer not null default 0,
+    resolved integer not null default 0,
+    resolve_seconds double precision not null default 0,   -- total (resolved_at - found_at) untuk MTTR
+    primary key (project, day)
+);
+
+create index if not exists issue_daily_rollup_day_idx on public.issue_daily_rollup (day);
+
+create table if not exists public.issue_user_rollup (
+    project text not null,
+    username text not null,
+    reported integer not null default 0,
+    resolved integer not null default 0,
+    primary key (project, username)
+);
+
+-- Tambah (sign = 1) atau kurangi (sign = -1) kontribusi satu baris issue
+create or replace function public.issue_rollup_apply(r public.issues, sign integer)
+returns void
+language plpgsql
+as $$
+begin
+    insert into public.issue_status_rollup as t (project, severity, open_count, resolved_count)
+    values (r.project, coalesce(r.severity, 'Unknown'),
+            case when r.status then 0 else sign end, case when r.status then sign else 0 end)
+    on conflict (project, severity) do update
+       set open_count = t.open_count + excluded.open_count,
+           resolved_count = t.resolved_count + excluded.resolved_count;
+
+    insert into public.issue_daily_rollup as t (project, day, opened)
+    values (r.project, (r.found_at at time zone 'Asia/Jakarta')::date, sign)
+    on conflict (project, day) do update set opened = t.opened + excluded.opened;
+
+    if r.reporter is not null then
+        insert into public.issue_user_rollup as t (project, username, reported)
+        values (r.project, r.reporter, sign)
+        on conflict (project, username) do update set reported = t.reported + excluded.reported;
+    end if;
+
+    if r.status and r.resolved_at is not null then
+        insert into public.issue_daily_rollup as t (project, day, resolved, resolve_seconds)
+        values (r.project, (r.resolved_at at time zone 'Asia/Jakarta')::date, sign,
+                sign * greatest(extract(epoch from r.resolved_at - r.found_at), 0))
+        on conflict (project, day) do update
+           set resolved = t.resolved + excluded.resolved,
+               resolve_seconds = t.resolve_seconds + excluded.resolve_seconds;
+    end if;
+
+    if r.status and r.resolved_by is not null then
+        insert into public.issue_user_rollup as t (project, username, resolved)
+        values (r.project, r.resolved_by, sign)
+        on conflict (project, username) do update set resolved = t.resolved + excluded.resolved;
+    end if;
+end;
+$$;
+
+create or replace function public.issues_rollup()
+returns trigger
+language plpgsql
+as $$
+begin
+    if tg_op = 'UPDATE'
+       and (old.project, old.severity, old.status, old.found_at, old.resolved_at, old.reporter, old.resolved_by)
+           is not distinct from
+           (new.project, new.severity, new.status, new.found_at, new.resolved_at, new.reporter, new.resolved_by) then
+        return new;   -- edit deskripsi/remarks dll. tidak mengubah rollup
+    end if;
+    if tg_op in ('UPDATE', 'DELETE') then perform public.issue_rollup_apply(old, -1); end if;
+    if tg_op in ('INSERT', 'UPDATE') then perform public.issue_rollup_apply(new, 1); end if;
+    return null;
+end;
+$$;
+
+drop trigger if exists issues_rollup on public.issues;
+create trigger issues_rollup
+    after insert or update or delete on public.issues
+    for each row execute function public.issues_rollup();
+
+-- Project dihapus: buang baris rollup-nya (isinya sudah nol setelah semua issue terhapus)
+create or replace function public.projects_rollup_cleanup()
+returns trigger
+language plpgsql
+as $$
+begin
+    delete from public.issue_status_rollup where project = old.name;
+    delete from public.issue_daily_rollup where project = old.name;
+    delete from public.issue_user_rollup where project = old.name;
+    return old;
+end;
+$$;
+
+drop trigger if exists projects_rollup_cleanup on public.projects;
+create trigger projects_rollup_cleanup
+    after delete on public.projects
+    for each row execute function public.projects_rollup_cleanup();
+
+-- Isi awal dari data yang sudah ada
+truncate public.issue_status_rollup, public.issue_daily_rollup, public.issue_user_rollup;
+select public.issue_rollup_apply(i, 1) from public.issues i;
+
+grant select on public.issue_status_rollup, public.issue_daily_rollup, public.issue_user_rollup to anon, authenticated;
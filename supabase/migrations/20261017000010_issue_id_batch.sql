@@ -0,0 +1,13 @@
+-- Alokasi banyak ID sekaligus untuk import (satu round-trip per batch)
+create or replace function public.next_issue_ids(n integer)
+returns setof text
+language sql
+volatile
+as $$
+    -- Format sama dengan next_issue_id(): minimal 3 digit, tidak pernah dipotong
+    select '#T-' || lpad(v::text, greatest(3, length(v::text)), '0')
+      from (select nextval('public.issue_id_seq') as v
+              from generate_series(1, least(greatest(n, 0), 1000))) ids;
+$$;
+
+grant execute on function public.next_issue_ids(integer) to anon, authenticated;
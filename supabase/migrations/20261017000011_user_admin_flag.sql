@@ -0,0 +1,2 @@
+-- Flag admin: panel Performance di sidebar hanya untuk user ini
+alter table public.users add column if not exists is_admin boolean not null default false;
@@ -0,0 +1,8 @@
+-- Urutan issue per nomor, bukan per teks id (secara teks '#T-1004' < '#T-101' < '#T-999').
+-- Nomor di-pad 20 digit lalu disambung id asli: unik, jadi bisa langsung dipakai keyset paging.
+-- collate "C" supaya urutannya byte-wise, sama dengan pembanding di app (issue_sort_key)
+alter table public.issues add column if not exists id_sort text collate "C"
+    generated always as (lpad(coalesce(substring(id from '([0-9]+)$'), ''), 20, '0') || id) stored;
+
+create index if not exists issues_project_id_sort_idx on public.issues (project, id_sort);
+create index if not exists issues_id_sort_idx on public.issues (id_sort);